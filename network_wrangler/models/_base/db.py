@@ -2,6 +2,7 @@ import copy
 import hashlib
 from collections import defaultdict
 from collections.abc import Callable
+from functools import cache
 from typing import ClassVar
 
 import pandas as pd
@@ -10,7 +11,7 @@ from pandera.errors import SchemaErrors
 
 from ...logger import WranglerLogger
 from ...params import SMALL_RECS
-from ...utils.data import fk_in_pk
+from ...utils.data import copy_on_write, fk_in_pk
 from ...utils.models import validate_df_to_model
 
 
@@ -136,7 +137,9 @@ class DBModelMixin:
     def __setattr__(self, key, value):
         """Override the default setattr behavior to handle DataFrame validation.
 
-        Note: this is NOT called when a dataframe is mutated in place!
+        Note: this is NOT called when a dataframe is mutated in place! Re-assigning the table
+        that is already set (e.g. `feed.shapes = feed.shapes`) skips validation and only marks
+        the database as modified.
 
         Args:
             key (str): The attribute name.
@@ -146,7 +149,10 @@ class DBModelMixin:
             SchemaErrors: If the DataFrame does not conform to the schema.
             ForeignKeyError: If doesn't validate to foreign key.
         """
-        if isinstance(value, pd.DataFrame):
+        if isinstance(value, pd.DataFrame) and value is self.__dict__.get(key):
+            if key in self.table_names or key in self.optional_table_names:
+                self._mark_modified()
+        elif isinstance(value, pd.DataFrame):
             WranglerLogger.debug(f"Validating + coercing value to {key}")
             df = self.validate_coerce_table(key, value)
             super().__setattr__(key, df)
@@ -204,8 +210,12 @@ class DBModelMixin:
             self.__setattr__(table, kwargs[table])
 
     @classmethod
+    @cache
     def fks(cls) -> DbForeignKeys:
-        """Return the fk field constraints as `{ <table>:{<field>:[<fk_table>,<fk_field>]} }`."""
+        """Return the fk field constraints as `{ <table>:{<field>:[<fk_table>,<fk_field>]} }`.
+
+        Cached per class since `_table_models` doesn't change at runtime.
+        """
         fk_fields = {}
         for table_name, table_model in cls._table_models.items():
             config = table_model.Config
@@ -215,12 +225,14 @@ class DBModelMixin:
         return fk_fields
 
     @classmethod
+    @cache
     def fields_as_fks(cls) -> DbForeignKeyUsage:
         """Returns mapping of tables that have fields that other tables use as fks.
 
         `{ <table>:{<field>:[(<table using FK>,<field using fk>)]} }`
 
         Useful for knowing if you should check FK validation when changing a field value.
+        Cached per class since `_table_models` doesn't change at runtime.
         """
         pks_as_fks: defaultdict = defaultdict(lambda: defaultdict(list))
         for t, field_fk in cls.fks().items():
@@ -237,8 +249,6 @@ class DBModelMixin:
         For example. If routes.route_id is referenced in trips table, we need to check that
         if a route_id is deleted, it isn't referenced in trips.route_id.
         """
-        msg = f"Checking tables which referenced {pk_table_name}.{pk_field} as an FK"
-        # WranglerLogger.debug(msg)
         if pk_table is None:
             pk_table = self.get_table(pk_table_name)
 
@@ -298,11 +308,13 @@ class DBModelMixin:
         if a route_id is deleted, it isn't referenced in trips.route_id.
         """
         # WranglerLogger.debug(f"Checking referenced foreign keys for {table_name}")
-        all_valid = True
+        referenced_fields = self.fields_as_fks().get(table_name)
+        if not referenced_fields:
+            return True
         if table is None:
             table = self.get_table(table_name)
         all_valid = True
-        for field in self.fields_as_fks().get(table_name, {}):
+        for field in referenced_fields:
             valid = self.check_referenced_fk(table_name, field, pk_table=table)
             all_valid = valid and all_valid
         return all_valid
@@ -414,12 +426,20 @@ class DBModelMixin:
         """A hash representing the contents of the tables in self.table_names.
 
         Note: This is an expensive operation. For change detection, prefer using
-        modification_version which is much faster.
+        modification_version which is much faster. The hash is cached until the
+        modification_version changes, so tables mutated in place without being set again
+        won't be reflected.
         """
+        _cached = self.__dict__.get("_hash_cache")
+        if _cached is not None and _cached[0] == self.modification_version:
+            return _cached[1]
+
         _table_hashes = [self.get_table(t).df_hash() for t in self.table_names]
         _value = str.encode("-".join(_table_hashes))
 
         _hash = hashlib.sha256(_value).hexdigest()
+        # Use object.__setattr__ to avoid table validation
+        object.__setattr__(self, "_hash_cache", (self.modification_version, _hash))
         return _hash
 
     def __eq__(self, other):
@@ -441,9 +461,14 @@ class DBModelMixin:
         """
         # Create a new, empty instance of the Feed class
         new_instance = self.__class__.__new__(self.__class__)
+        # With copy-on-write, tables can share buffers until either copy is edited
+        deep_tables = not copy_on_write()
 
         # Copy all attributes to the new instance
         for attr_name, attr_value in self.__dict__.items():
+            # copies are often edited in place, so don't carry over a cached hash
+            if attr_name == "_hash_cache":
+                continue
             # Handle pandera DataFrameModel objects specially
             if (
                 hasattr(attr_value, "__class__")
@@ -455,12 +480,12 @@ class DBModelMixin:
                 try:
                     # Get the underlying DataFrame
                     if hasattr(attr_value, "_obj"):
-                        df_copy = attr_value._obj.copy(deep=True)
+                        df_copy = attr_value._obj.copy(deep=deep_tables)
                     elif hasattr(attr_value, "data"):
-                        df_copy = attr_value.data.copy(deep=True)
+                        df_copy = attr_value.data.copy(deep=deep_tables)
                     else:
                         # For newer pandera versions, try direct access
-                        df_copy = attr_value.copy(deep=True)
+                        df_copy = attr_value.copy(deep=deep_tables)
 
                     # Recreate the DataFrameModel object with the copied DataFrame
                     new_table = attr_value.__class__(df_copy)
@@ -470,8 +495,7 @@ class DBModelMixin:
                     # Fallback to regular deep copy if the above fails
                     setattr(new_instance, attr_name, copy.deepcopy(attr_value, memo))
             elif isinstance(attr_value, pd.DataFrame):
-                # For plain pandas DataFrames, use deep copy
-                setattr(new_instance, attr_name, attr_value.copy(deep=True))
+                setattr(new_instance, attr_name, attr_value.copy(deep=deep_tables))
             else:
                 # For all other objects, use regular deep copy
                 setattr(new_instance, attr_name, copy.deepcopy(attr_value, memo))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from datetime import time
 from typing import Any, Literal, TypeVar
 
@@ -26,6 +27,9 @@ PhoneNum = str
 TimeString = str
 
 
+_TIME_STRING_RE = re.compile(r"^(\d+):([0-5]\d)(:[0-5]\d)?$")
+
+
 # Standalone validator for timespan strings
 def validate_timespan_string(value: Any) -> list[str]:
     """Validate that value is a list of exactly 2 time strings in HH:MM or HH:MM:SS format.
@@ -43,9 +47,7 @@ def validate_timespan_string(value: Any) -> list[str]:
         if not isinstance(item, str):
             msg = "TimespanString elements must be strings"
             raise ValueError(msg)
-        import re
-
-        if not re.match(r"^(\d+):([0-5]\d)(:[0-5]\d)?$", item):
+        if not _TIME_STRING_RE.match(item):
             msg = f"Invalid time format: {item}"
             raise ValueError(msg)
     return value
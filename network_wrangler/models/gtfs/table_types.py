@@ -7,6 +7,11 @@ import pandas as pd
 from pandera.dtypes import DataType
 from pandera.engines import pandas_engine
 
+# Regex pattern for HTTP URLs
+HTTP_URL_PATTERN = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+
 
 @pandas_engine.Engine.register_dtype
 class HttpURL(pandas_engine.NpString):
@@ -25,11 +30,8 @@ class HttpURL(pandas_engine.NpString):
         if not correct_type:
             return correct_type
 
-        # Define a regex pattern for HTTP URLs
-        pattern = re.compile(
-            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        )
-        return data_container.map(lambda x: pattern.match(x) is not None)
+        # missing values are left to the column's nullable check
+        return data_container.isna() | data_container.str.match(HTTP_URL_PATTERN, na=False)
 
     def __str__(self) -> str:
         """String representation of the DataType."""
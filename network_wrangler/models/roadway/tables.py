@@ -16,6 +16,7 @@ from __future__ import annotations
 import datetime as dt
 from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 import pandera as pa
 from pandas import Int64Dtype as Int64
@@ -303,16 +304,27 @@ class RoadLinksTable(DataFrameModel):
         coerce = True
         unique: ClassVar[list[str]] = ["A", "B"]
 
-    @pa.check("sc_*", regex=True, element_wise=True)
-    def check_scoped_fields(cls, scoped_value: Series) -> Series[bool]:
+    @pa.check("sc_*", regex=True)
+    def check_scoped_fields(cls, scoped_values: Series) -> Series[bool]:
         """Checks that all fields starting with 'sc_' or 'sc_ML_' are valid ScopedLinkValueList.
 
         Custom check to validate fields starting with 'sc_' or 'sc_ML_'
         against a ScopedLinkValueItem model, handling both mandatory and optional fields.
+        Links commonly share the same scoped values, so each distinct value is only
+        validated once.
         """
-        if scoped_value is None or (not isinstance(scoped_value, list) and pd.isna(scoped_value)):
-            return True
-        return validate_pyd(scoped_value, ScopedLinkValueList)
+        valid = np.ones(len(scoped_values), dtype=bool)
+        valid_by_repr: dict[str, bool] = {}
+        for i, scoped_value in enumerate(scoped_values):
+            if scoped_value is None or (
+                not isinstance(scoped_value, list) and pd.isna(scoped_value)
+            ):
+                continue
+            key = repr(scoped_value)
+            if key not in valid_by_repr:
+                valid_by_repr[key] = validate_pyd(scoped_value, ScopedLinkValueList)
+            valid[i] = valid_by_repr[key]
+        return pd.Series(valid, index=scoped_values.index)
 
 
 RoadNodesAttrs = {
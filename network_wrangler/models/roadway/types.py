@@ -83,14 +83,15 @@ class ScopedLinkValueList(RootListMixin, RootModel):
     def check_conflicting_scopes(self):
         """Check for conflicting scopes in the list."""
         conflicts = []
-        for i in self:
+        # parse each item's timespan once rather than once per pairwise comparison
+        items_dt = [(i, i.timespan_dt) for i in self]
+        for i, i_dt in items_dt:
             if i.timespan == DEFAULT_TIMESPAN:
                 continue
-            overlapping_ts_i = self.overlapping_timespans(i.timespan)
-            for j in overlapping_ts_i:
-                if j == i:
+            for j, j_dt in items_dt:
+                if j == i or j.category != i.category:
                     continue
-                if j.category == i.category:
+                if dt_overlaps(j_dt, i_dt):
                     conflicts.append((i, j))
         if conflicts:
             msg = "Conflicting scopes in ScopedLinkValueList:\n"
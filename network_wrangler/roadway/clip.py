@@ -22,7 +22,6 @@ write_roadway(clipped_network, out_dir, prefix="ecolab", format="geojson", true_
 
 from __future__ import annotations
 
-import copy
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -30,6 +29,7 @@ import geopandas as gpd
 
 from ..logger import WranglerLogger
 from ..params import LAT_LON_CRS
+from ..utils.data import copy_to_edit
 from ..utils.geo import get_bounding_polygon
 from .links.links import node_ids_in_links
 
@@ -88,9 +88,9 @@ def clip_roadway_to_dfs(
     filtered_shapes_df = network.shapes_df[
         network.shapes_df.index.isin(filtered_links_df["shape_id"])
     ]
-    trimmed_links_df = copy.deepcopy(filtered_links_df)
-    trimmed_nodes_df = copy.deepcopy(filtered_nodes_df)
-    trimmed_shapes_df = copy.deepcopy(filtered_shapes_df)
+    trimmed_links_df = copy_to_edit(filtered_links_df)
+    trimmed_nodes_df = copy_to_edit(filtered_nodes_df)
+    trimmed_shapes_df = copy_to_edit(filtered_shapes_df)
     return trimmed_links_df, trimmed_nodes_df, trimmed_shapes_df
 
 
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING
 
 import networkx as nx
 import osmnx as ox
 from geopandas import GeoDataFrame
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype
 
 from ..logger import WranglerLogger
 from .nodes.filters import filter_nodes_to_links
@@ -28,17 +28,38 @@ DEFAULT_GRAPH_WEIGHT_COL = "distance"
 DEFAULT_GRAPH_WEIGHT_FACTOR = 1
 
 
+_SCALAR_INFERRED_DTYPES = {
+    "string",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "boolean",
+    "empty",
+}
+
+
+def _is_complex_column(s: Series) -> bool:
+    """True if the series contains any lists, tuples or dictionaries.
+
+    Only object columns can hold these, and `infer_dtype` screens out object columns holding a
+    single scalar kind (e.g. strings) without visiting each value in python. Mixed kinds such as
+    "mixed-integer" can still hold lists, so those are checked value by value.
+    """
+    if s.dtype != object:
+        return False
+    if infer_dtype(s, skipna=True) in _SCALAR_INFERRED_DTYPES:
+        return False
+    return s.map(type).isin((list, dict, tuple)).any()
+
+
 def _drop_complex_df_columns(df: DataFrame) -> DataFrame:
     """Returns dataframe without columns with lists, tuples or dictionaries types."""
     _cols_to_exclude = ["geometry"]
     _cols_to_search = [c for c in df.columns if c not in _cols_to_exclude]
-    _drop_types = (list, dict, tuple)
-
-    _drop_cols = [c for c in _cols_to_search if df[c].apply(type).isin(_drop_types).any()]
-
-    df = df.drop(_drop_cols, axis=1)
+    _drop_cols = [c for c in _cols_to_search if _is_complex_column(df[c])]
 
-    return df
+    # drop returns a new frame, so there is no need to deepcopy the input
+    return df.drop(_drop_cols, axis=1)
 
 
 def _nodes_to_graph_nodes(nodes_df: GeoDataFrame) -> GeoDataFrame:
@@ -52,11 +73,9 @@ def _nodes_to_graph_nodes(nodes_df: GeoDataFrame) -> GeoDataFrame:
     Args:
         nodes_df (GeoDataFrame): nodes geodataframe from RoadwayNetwork instance
     """
-    graph_nodes_df = copy.deepcopy(nodes_df)
-    graph_nodes_df.gdf_name = "network_nodes"
-
     # drop column types which could have complex types (i.e. lists, dicts, etc)
-    graph_nodes_df = _drop_complex_df_columns(graph_nodes_df)
+    graph_nodes_df = _drop_complex_df_columns(nodes_df)
+    graph_nodes_df.gdf_name = "network_nodes"
 
     # the model_node_id is the index
     graph_nodes_df.set_index("model_node_id", inplace=True)
@@ -82,10 +101,8 @@ def _links_to_graph_links(
         sp_weight_col: column to use for weights. Defaults to `distance`.
         sp_weight_factor: multiple to apply to the weights. Defaults to 1.
     """
-    graph_links_df = copy.deepcopy(links_df)
-
     # drop column types which could have complex types (i.e. lists, dicts, etc)
-    graph_links_df = _drop_complex_df_columns(graph_links_df)
+    graph_links_df = _drop_complex_df_columns(links_df)
 
     # have to add in weights to use for shortest paths before doing the conversion to a graph
     if sp_weight_col not in graph_links_df.columns:
@@ -176,6 +193,62 @@ def links_nodes_to_ox_graph(
     return G
 
 
+def links_to_sp_graph(
+    links_df: DataFrame,
+    nodes_df: DataFrame,
+    sp_weight_col: str = DEFAULT_GRAPH_WEIGHT_COL,
+    sp_weight_factor: float = DEFAULT_GRAPH_WEIGHT_FACTOR,
+) -> nx.DiGraph:
+    """Create a directed graph with only what is needed to find shortest paths.
+
+    Each edge only has a `weight`, the lowest of any parallel links between its A and B, so it is
+    much cheaper to build than `links_nodes_to_ox_graph` which copies every link attribute and
+    geometry onto the edges. Nodes and edges are added in the same order so ties between
+    equally short paths resolve the same way.
+
+    Args:
+        links_df: links_df from RoadwayNetwork
+        nodes_df: nodes_df from RoadwayNetwork
+        sp_weight_col: column to use for weights. Defaults to `distance`.
+        sp_weight_factor: multiple to apply to the weights. Defaults to 1.
+
+    Returns: a networkx DiGraph
+    """
+    G = nx.DiGraph()
+    G.add_nodes_from(nodes_df["model_node_id"].tolist())
+    add_links_to_sp_graph(G, links_df, sp_weight_col, sp_weight_factor)
+    return G
+
+
+def add_links_to_sp_graph(
+    G: nx.DiGraph,
+    links_df: DataFrame,
+    sp_weight_col: str = DEFAULT_GRAPH_WEIGHT_COL,
+    sp_weight_factor: float = DEFAULT_GRAPH_WEIGHT_FACTOR,
+) -> None:
+    """Add links to a graph from `links_to_sp_graph` in place, keeping the lowest edge weights.
+
+    Lets a graph grow with its links rather than being rebuilt from all of them.
+
+    Args:
+        G: networkx DiGraph created using links_to_sp_graph
+        links_df: links to add
+        sp_weight_col: column to use for weights. Defaults to `distance`.
+        sp_weight_factor: multiple to apply to the weights. Defaults to 1.
+    """
+    if sp_weight_col in links_df.columns:
+        weights = links_df[sp_weight_col] * sp_weight_factor
+    else:
+        WranglerLogger.warning(f"{sp_weight_col} not in links_df so using weights of 1.")
+        weights = Series(sp_weight_factor, index=links_df.index)
+    weights = weights.groupby([links_df["A"], links_df["B"]], sort=False).min()
+
+    for (a, b), w in weights.items():
+        if G.has_edge(a, b) and G[a][b]["weight"] <= w:
+            continue
+        G.add_edge(a, b, weight=w)
+
+
 def net_to_graph(net: RoadwayNetwork, mode: str | None = None) -> nx.MultiDiGraph:
     """Converts a network to a MultiDiGraph.
 
@@ -195,11 +268,11 @@ def net_to_graph(net: RoadwayNetwork, mode: str | None = None) -> nx.MultiDiGrap
     return G
 
 
-def shortest_path(G: nx.MultiDiGraph, O_id, D_id, sp_weight_property="weight") -> list | None:
+def shortest_path(G: nx.DiGraph, O_id, D_id, sp_weight_property="weight") -> list | None:
     """Calculates the shortest path between two nodes in a network.
 
     Args:
-        G: osmnx MultiDiGraph, created using links_nodes_to_ox_graph
+        G: networkx graph, created using links_nodes_to_ox_graph or links_to_sp_graph
         O_id: primary key for start node
         D_id: primary key for end node
         sp_weight_property: link property to use as weight in finding shortest path.
@@ -212,7 +285,8 @@ def shortest_path(G: nx.MultiDiGraph, O_id, D_id, sp_weight_property="weight") -
     - links in shortest path selected from links_df
     """
     try:
-        sp_route = nx.shortest_path(G, O_id, D_id, weight=sp_weight_property)
+        # bidirectional search settles far fewer nodes than single-source dijkstra
+        _, sp_route = nx.bidirectional_dijkstra(G, O_id, D_id, weight=sp_weight_property)
         WranglerLogger.debug("Shortest path successfully routed")
     except nx.NetworkXNoPath:
         WranglerLogger.debug(f"No SP from {O_id} to {D_id} Found.")
@@ -106,11 +106,10 @@ def load_roadway(
         filter_to_nodes=filter_links_to_nodes,
     )
 
-    roadway_network = RoadwayNetwork(
-        links_df=links_df,
-        nodes_df=nodes_df,
-        shapes_df=shapes_df,
-        config=config,
+    # links_df and nodes_df were validated when they were read, so don't validate them again
+    roadway_network = RoadwayNetwork.model_validate(
+        {"links_df": links_df, "nodes_df": nodes_df, "shapes_df": shapes_df, "config": config},
+        context={"tables_validated": True},
     )
     if shapes_file and shapes_file.exists():
         roadway_network._shapes_file = shapes_file
@@ -152,6 +151,7 @@ def load_roadway_from_dataframes(
     )
     from ..utils.models import validate_df_to_model
     from .links.create import data_to_links_df
+    from .links.filters import filter_links_between_node_ids
     from .network import RoadwayNetwork
     from .nodes.create import data_to_nodes_df
     from .shapes.create import df_to_shapes_df
@@ -165,9 +165,7 @@ def load_roadway_from_dataframes(
 
     if filter_to_nodes:
         link_count = len(links_df)
-        links_df = links_df[
-            links_df["A"].isin(nodes_df.model_node_id) & links_df["B"].isin(nodes_df.model_node_id)
-        ]
+        links_df = filter_links_between_node_ids(links_df, nodes_df.model_node_id)
         WranglerLogger.debug(
             f"Filtered links to only those that connect to nodes: "
             f"filtered {link_count - len(links_df)} links"
@@ -181,12 +179,16 @@ def load_roadway_from_dataframes(
         WranglerLogger.debug("Processing shapes_df through df_to_shapes_df")
         processed_shapes_df = df_to_shapes_df(shapes_df)
 
-    # Create RoadwayNetwork with processed DataFrames that have attrs set
-    roadway_network = RoadwayNetwork(
-        links_df=processed_links_df,
-        nodes_df=processed_nodes_df,
-        shapes_df=processed_shapes_df,
-        config=config,
+    # Create RoadwayNetwork with processed DataFrames that have attrs set. They were validated
+    # by data_to_links_df and data_to_nodes_df, so don't validate them again.
+    roadway_network = RoadwayNetwork.model_validate(
+        {
+            "links_df": processed_links_df,
+            "nodes_df": processed_nodes_df,
+            "shapes_df": processed_shapes_df,
+            "config": config,
+        },
+        context={"tables_validated": True},
     )
 
     return roadway_network
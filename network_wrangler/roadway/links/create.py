@@ -1,6 +1,5 @@
 """Functions for creating RoadLinksTables."""
 
-import copy
 import time
 
 import geopandas as gpd
@@ -201,10 +200,19 @@ def copy_links(
             k: v for k, v in rename_properties.items() if k not in _missing_rename_properties
         }
 
-    offset_links = copy.deepcopy(links_df)
-    drop_before_rename = [k for k in rename_properties.values() if k in offset_links.columns]
-    offset_links = offset_links.drop(columns=drop_before_rename)
-    offset_links = offset_links.rename(columns=rename_properties)
+    keep_properties = list(set(copy_properties + REQUIRED_KEEP + list(rename_properties.values())))
+
+    # Select just the columns that are kept, dropping any that a rename would overwrite, and
+    # rename them in one pass rather than copying and then trimming the full links table.
+    rename_targets = set(rename_properties.values())
+    source_cols = [
+        c
+        for c in links_df.columns
+        if c == updated_geometry_col
+        or c in rename_properties
+        or (c in keep_properties and c not in rename_targets)
+    ]
+    offset_links = links_df[source_cols].rename(columns=rename_properties)
 
     offset_links["A"] = offset_links["source_A"].map(node_id_lookup)
     offset_links["B"] = offset_links["source_B"].map(node_id_lookup)
@@ -236,7 +244,6 @@ def copy_links(
     offset_links.crs = links_df.crs
     offset_links["distance"] = length_of_linestring_miles(offset_links["geometry"])
 
-    keep_properties = list(set(copy_properties + REQUIRED_KEEP + list(rename_properties.values())))
     offset_links = offset_links[keep_properties]
 
     # create and set index for new model_link_ids
@@ -31,7 +31,8 @@ def delete_links_by_ids(
         transit_net: If provided, will check TransitNetwork and warn if deletion breaks transit shapes. Defaults to None.
     """
     WranglerLogger.debug(f"Deleting links with ids: \n{del_link_ids}")
-    _missing = set(del_link_ids) - set(links_df.index)
+    # look ids up in the index rather than building a set of every id in the table
+    _missing = {i for i in del_link_ids if i not in links_df.index}
     if _missing:
         WranglerLogger.warning(f"Links in network not there to delete: \n{_missing}")
         if not ignore_missing:
@@ -23,7 +23,6 @@ links_df = edit_link_geometry_from_nodes(links_df, nodes_df, node_ids)
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Literal
 
 import geopandas as gpd
@@ -41,7 +40,7 @@ from ...models.projects.roadway_changes import (
 )
 from ...models.roadway.tables import RoadLinksAttrs, RoadLinksTable, RoadNodesAttrs, RoadNodesTable
 from ...models.roadway.types import ScopedLinkValueItem
-from ...utils.data import validate_existing_value_in_df
+from ...utils.data import copy_to_edit, validate_existing_value_in_df
 from ...utils.geo import offset_geometry_meters, update_nodes_in_linestring_geometry
 from ...utils.models import default_from_datamodel, validate_call_pyd, validate_df_to_model
 from .scopes import (
@@ -49,6 +48,9 @@ from .scopes import (
     _filter_to_matching_scope,
 )
 
+# managed lane access/egress point properties and the link node they refer to
+ML_ACCESS_EGRESS_NODE_COL = {"ML_access_point": "A", "ML_egress_point": "B"}
+
 
 def _initialize_links_as_managed_lanes(
     links_df: DataFrame[RoadLinksTable],
@@ -147,12 +149,6 @@ def _edit_scoped_link_property(
             will overwrite conflicting scoped properties. If 'error', will raise an error on
             conflicting scoped properties. Defaults to 'error'.
     """
-    msg = f"Setting scoped link property.\n\
-            - Current value:{scoped_prop_value_list}\n\
-            - Set value: {scoped_prop_set}\n\
-            - Default value: {default_value}\n\
-            - Overwrite scoped: {overwrite_scoped}"
-    # WranglerLogger.debug(msg)
     # If None, or asked to overwrite all scopes, and return all set items
     if overwrite_scoped == "all" or not scoped_prop_value_list:
         scoped_prop_value_list = [
@@ -161,8 +157,9 @@ def _edit_scoped_link_property(
         # WranglerLogger.debug(f"Scoped link property:\n{scoped_prop_value_list}")
         return scoped_prop_value_list
 
-    # Copy so not iterating over something that is changing
-    updated_scoped_prop_value_list = copy.deepcopy(scoped_prop_value_list)
+    # Copy the list so appending doesn't change the caller's list. The items themselves are
+    # never mutated (edits build new ScopedLinkValueItems), so they don't need to be copied.
+    updated_scoped_prop_value_list = list(scoped_prop_value_list)
 
     for set_item in scoped_prop_set:
         WranglerLogger.debug(f"Editing link for scoped item: {set_item}")
@@ -208,19 +205,19 @@ def _edit_ml_access_egress_points(
     link_idx: list[int],
 ):
     """Edit ML access or egress points on links."""
-    prop_to_node_col = {"ML_access_point": "A", "ML_egress_point": "B"}
-    node_col = prop_to_node_col[prop_name]
+    node_col = ML_ACCESS_EGRESS_NODE_COL[prop_name]
     if prop_change.set == "all":
         WranglerLogger.debug(f"Setting all {prop_name} to True")
         links_df.loc[link_idx, prop_name] = True
     elif isinstance(prop_change.set, list):
-        mask = (links_df[node_col].isin(prop_change.set)) & (links_df.index.isin(link_idx))
+        # only the selected links can be access/egress points, so just check their nodes
+        selected_nodes = links_df.loc[link_idx, node_col]
+        point_idx = selected_nodes.index[selected_nodes.isin(prop_change.set)]
 
         WranglerLogger.debug(
-            f"Setting {prop_name} to True for {len(links_df.loc[mask])} links: \n\
-                            {links_df.loc[mask, ['model_link_id', 'A', 'B']]}"
+            f"Setting {prop_name} to True for {len(point_idx)} links: {point_idx.tolist()}"
         )
-        links_df.loc[mask, prop_name] = True
+        links_df.loc[point_idx, prop_name] = True
     else:
         msg = f"Invalid value for {prop_name}. Must be list of ints or 'all': {prop_change.set}."
         WranglerLogger.error(msg + f" Must be list of ints or 'all': {prop_change.set}")
@@ -275,7 +272,7 @@ def _edit_link_property(
 
     WranglerLogger.debug(f"Editing {prop_name} to {prop_change}")
 
-    if prop_name in ["ML_access_point", "ML_egress_point"]:
+    if prop_name in ML_ACCESS_EGRESS_NODE_COL:
         links_df = _edit_ml_access_egress_points(links_df, prop_name, prop_change, link_idx)
     elif prop_change.set is not None:
         WranglerLogger.debug(f"Setting {prop_name} to {prop_change.set}")
@@ -354,6 +351,29 @@ def _edit_scoped_property(
     return links_df
 
 
+def _block_settable_values(
+    links_df: DataFrame[RoadLinksTable], property_changes: dict[str, dict]
+) -> dict[str, Any]:
+    """Values of property changes that only set an existing column to a scalar.
+
+    These don't need any of the existing-value, scoped, or managed lane handling in
+    `_edit_link_property`, so they can all be written to the selected links in one assignment.
+    """
+    block_set_values = {}
+    for prop_name, prop_change in property_changes.items():
+        _change = {k: v for k, v in prop_change.items() if v is not None}
+        if list(_change) != ["set"] or prop_name not in links_df.columns:
+            continue
+        if prop_name.startswith(("ML_", "sc_")) or isinstance(_change["set"], (list, dict)):
+            continue
+        set_value = _change["set"]
+        # Cast value to column dtype to avoid pandas dtype incompatibility warnings
+        if links_df[prop_name].dtype == bool and not isinstance(set_value, bool):
+            set_value = bool(set_value)
+        block_set_values[prop_name] = set_value
+    return block_set_values
+
+
 @validate_call_pyd
 def edit_link_properties(
     links_df: DataFrame[RoadLinksTable],
@@ -371,7 +391,7 @@ def edit_link_properties(
         project_name: optional name of the project to be applied
         config: WranglerConfig instance. Defaults to DefaultConfig.
     """
-    links_df = copy.deepcopy(links_df)
+    links_df = copy_to_edit(links_df)
     # TODO write wrapper on validate call so don't have to do this
     links_df.attrs.update(RoadLinksAttrs)
     ml_property_changes = bool([k for k in property_changes if k.startswith("ML_")])
@@ -379,7 +399,14 @@ def edit_link_properties(
     flag_create_managed_lane = existing_managed_lanes & ml_property_changes
 
     # WranglerLogger.debug(f"property_changes: \n{property_changes}")
+    block_set_values = _block_settable_values(links_df, property_changes)
+    if block_set_values:
+        WranglerLogger.debug(f"Setting {list(block_set_values)} to {block_set_values}")
+        links_df.loc[link_idx, list(block_set_values)] = list(block_set_values.values())
+
     for property, prop_change in property_changes.items():
+        if property in block_set_values:
+            continue
         WranglerLogger.debug(f"prop_dict: \n{prop_change}")
         links_df = _edit_link_property(
             links_df,
@@ -408,7 +435,15 @@ def edit_link_properties(
             )
             links_df.loc[link_idx, "ML_egress_point"] = True
 
-    links_df = validate_df_to_model(links_df, RoadLinksTable)
+    # managed lane and scoped edits change more columns than the properties they name, but the
+    # rest of the already validated table only needs its edited columns checked
+    edited_cols = None
+    if not any(
+        k.startswith(("ML_", "sc_")) or v.get("scoped") is not None
+        for k, v in property_changes.items()
+    ):
+        edited_cols = [*property_changes, "projects"]
+    links_df = validate_df_to_model(links_df, RoadLinksTable, columns=edited_cols)
     return links_df
 
 
@@ -431,7 +466,7 @@ def edit_link_geometry_from_nodes(
     # TODO write wrapper on validate call so don't have to do this
     links_df.attrs.update(RoadLinksAttrs)
     nodes_df.attrs.update(RoadNodesAttrs)
-    links_df = copy.deepcopy(links_df)
+    links_df = copy_to_edit(links_df)
 
     updated_a_geometry = update_nodes_in_linestring_geometry(
         links_df.loc[links_df.A.isin(node_ids)], nodes_df, 0
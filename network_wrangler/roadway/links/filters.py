@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from ...logger import WranglerLogger
+from ...models.roadway.tables import RoadLinksAttrs
 from ...params import MODES_TO_NETWORK_LINK_VARIABLES
+from ...utils.data import index_isin
 
 if TYPE_CHECKING:
     from pandera.typing import DataFrame
@@ -152,21 +155,45 @@ def filter_links_to_node_ids(
     links_df: DataFrame[RoadLinksTable], node_ids: list[int]
 ) -> DataFrame[RoadLinksTable]:
     """Filters links dataframe to only include links with either A or B in node_ids."""
-    return links_df.loc[links_df["A"].isin(node_ids) | links_df["B"].isin(node_ids)]
+    a_in_nodes, b_in_nodes = _link_nodes_masks(links_df, node_ids)
+    return links_df.loc[a_in_nodes | b_in_nodes]
+
+
+def filter_links_between_node_ids(
+    links_df: DataFrame[RoadLinksTable], node_ids: list[int] | pd.Series
+) -> DataFrame[RoadLinksTable]:
+    """Filters links dataframe to only include links with both A and B in node_ids."""
+    a_in_nodes, b_in_nodes = _link_nodes_masks(links_df, node_ids)
+    return links_df.loc[a_in_nodes & b_in_nodes]
+
+
+def _link_nodes_masks(
+    links_df: DataFrame[RoadLinksTable], node_ids: list[int] | pd.Series
+) -> tuple[np.ndarray, np.ndarray]:
+    """Masks of links whose A and whose B are in node_ids, hashing node_ids only once."""
+    node_idx = pd.Index(node_ids).unique()
+    return node_idx.get_indexer(links_df["A"]) >= 0, node_idx.get_indexer(links_df["B"]) >= 0
 
 
 def filter_links_to_ids(
     links_df: DataFrame[RoadLinksTable], link_ids: list[int]
 ) -> DataFrame[RoadLinksTable]:
     """Filters links dataframe by link_ids."""
-    return links_df.loc[links_df["model_link_id"].isin(link_ids)]
+    return links_df.loc[_link_ids_mask(links_df, link_ids)]
 
 
 def filter_links_not_in_ids(
     links_df: DataFrame[RoadLinksTable], link_ids: list[int] | pd.Series
 ) -> DataFrame[RoadLinksTable]:
     """Filters links dataframe to NOT have link_ids."""
-    return links_df.loc[~links_df["model_link_id"].isin(link_ids)]
+    return links_df.loc[~_link_ids_mask(links_df, link_ids)]
+
+
+def _link_ids_mask(links_df: DataFrame[RoadLinksTable], link_ids: list[int] | pd.Series):
+    """Mask of links in link_ids, using the model_link_id index when links_df has it."""
+    if links_df.index.name == RoadLinksAttrs["idx_col"]:
+        return index_isin(links_df.index, link_ids)
+    return links_df["model_link_id"].isin(link_ids).to_numpy()
 
 
 def filter_links_to_path(
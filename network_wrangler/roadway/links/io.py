@@ -17,6 +17,7 @@ from ...params import LAT_LON_CRS
 from ...utils.io_table import read_table, write_table
 from ...utils.models import order_fields_from_data_model, validate_call_pyd
 from .create import data_to_links_df
+from .filters import filter_links_between_node_ids
 
 
 @validate_call_pyd
@@ -48,13 +49,16 @@ def read_links(
         msg = "If filter_to_nodes is True, nodes_df must be provided."
         raise ValueError(msg)
 
-    links_df = read_table(filename, read_speed=config.CPU.EST_PD_READ_SPEED)
+    filters = None
+    if filter_to_nodes:
+        # parquet skips links outside of the nodes while reading
+        node_ids = nodes_df.model_node_id.tolist()
+        filters = [("A", "in", node_ids), ("B", "in", node_ids)]
+    links_df = read_table(filename, read_speed=config.CPU.EST_PD_READ_SPEED, filters=filters)
 
     if filter_to_nodes:
         WranglerLogger.debug("Filtering links to only those that connect to nodes.")
-        links_df = links_df[
-            links_df["A"].isin(nodes_df.model_node_id) & links_df["B"].isin(nodes_df.model_node_id)
-        ]
+        links_df = filter_links_between_node_ids(links_df, nodes_df.model_node_id)
 
     WranglerLogger.debug(f"Read {len(links_df)} links in {round(time.time() - start_t, 2)}.")
     links_df = data_to_links_df(links_df, in_crs=in_crs, nodes_df=nodes_df)
@@ -72,7 +76,7 @@ def write_links(
     out_dir: str | Path = ".",
     convert_complex_properties_to_single_field: bool = False,
     prefix: str = "",
-    file_format: GeoFileTypes = "json",
+    file_format: GeoFileTypes = "parquet",
     overwrite: bool = False,
     include_geometry: bool = False,
 ) -> None:
@@ -85,7 +89,9 @@ def write_links(
             with parquet and many other softwares. Defaults to False.
         out_dir: directory to write files to. Defaults to ".".
         prefix: prefix to add to the filename. Defaults to "".
-        file_format: file format to write out to. Defaults to "json".
+        file_format: file format to write out to. Parquet is much faster to read and write
+            than json and keeps column dtypes; with include_geometry it is written as
+            geoparquet. Defaults to "parquet".
         overwrite: if True, will overwrite existing files. Defaults to False.
         include_geometry: if True, will include geometry in the output. Defaults to False.
     """
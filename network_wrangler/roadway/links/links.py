@@ -1,5 +1,6 @@
 """Functions for querying RoadLinksTable."""
 
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 
@@ -23,7 +24,8 @@ def node_ids_in_links(
     Returns:
         List[int]: list of unique node_ids
     """
-    _node_ids = pd.concat([links_df["A"], links_df["B"]]).unique()
+    # unique on the raw arrays avoids building an intermediate concatenated Series + index
+    _node_ids = pd.unique(np.concatenate([links_df["A"].to_numpy(), links_df["B"].to_numpy()]))
 
     if nodes_df is not None:
         validate_links_have_nodes(links_df, nodes_df)
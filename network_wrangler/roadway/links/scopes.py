@@ -38,6 +38,7 @@ model_links_df["lanes_AM_sov"] = prop_for_scope(links_df, ["6:00":"9:00"], categ
 from __future__ import annotations
 
 import copy
+import logging
 from typing import Any, TypeGuard
 
 import pandas as pd
@@ -263,7 +264,8 @@ def _create_exploded_df_for_scoped_prop(
 
     # 2. Create a record for each scope
     exp_df = scoped_values_df.explode(f"sc_{prop_name}")
-    WranglerLogger.debug(f"Exploded Records: \n{exp_df}")
+    if WranglerLogger.isEnabledFor(logging.DEBUG):
+        WranglerLogger.debug(f"Exploded Records: \n{exp_df}")
 
     # 3. normalize dictionary to columns for each dictionary key: category, timespan, value
     #       convert to dictionary from data model
@@ -272,7 +274,8 @@ def _create_exploded_df_for_scoped_prop(
     )
     normalized_scope_df = pd.json_normalize(exp_df.pop(f"sc_{prop_name}")).set_index(exp_df.index)
     exp_df = scoped_values_df[["model_link_id"]].join(normalized_scope_df)
-    WranglerLogger.debug(f"Exploded columns: \n{exp_df}")
+    if WranglerLogger.isEnabledFor(logging.DEBUG):
+        WranglerLogger.debug(f"Exploded columns: \n{exp_df}")
 
     # 4. Fill default category (timespan query should take care of this itself)
     if "category" not in exp_df.columns:
@@ -286,7 +289,8 @@ def _create_exploded_df_for_scoped_prop(
     # 6. Tidy up and align with data model for export
     exp_df = exp_df.rename(columns={"value": "scoped"})
     exp_df = ExplodedScopedLinkPropertyTable(exp_df)
-    WranglerLogger.debug(f"exp_df: \n{exp_df}")
+    if WranglerLogger.isEnabledFor(logging.DEBUG):
+        WranglerLogger.debug(f"exp_df: \n{exp_df}")
 
     return exp_df
 
@@ -332,7 +336,8 @@ def _filter_exploded_df_to_scope(
             strict_match=strict_timespan_match,
             min_overlap_minutes=min_overlap_minutes,
         )
-    WranglerLogger.debug(f"match_df: \n{match_df}")
+    if WranglerLogger.isEnabledFor(logging.DEBUG):
+        WranglerLogger.debug(f"match_df: \n{match_df}")
     return match_df
 
 
@@ -399,9 +404,10 @@ def prop_for_scope(
     # Attach them back to all links and update default.
     result_df = copy.deepcopy(links_df[["model_link_id", prop_name]])
     result_df.loc[scoped_prop_df.index, prop_name] = scoped_prop_df["scoped"]
-    WranglerLogger.debug(
-        f"result_df[prop_name]: \n{result_df.loc[scoped_prop_df.index, prop_name]}"
-    )
+    if WranglerLogger.isEnabledFor(logging.DEBUG):
+        WranglerLogger.debug(
+            f"result_df[prop_name]: \n{result_df.loc[scoped_prop_df.index, prop_name]}"
+        )
     return result_df
 
 
@@ -492,7 +498,8 @@ def props_for_scopes(
         )
         col = base.copy()
         col.loc[filtered.index] = filtered["scoped"]
-        WranglerLogger.debug(f"props_for_scopes [{scope['label']}]: {col.loc[filtered.index]}")
+        if WranglerLogger.isEnabledFor(logging.DEBUG):
+            WranglerLogger.debug(f"props_for_scopes [{scope['label']}]: {col.loc[filtered.index]}")
         result[scope["label"]] = col
 
     return result
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 
@@ -15,7 +15,7 @@ from ..errors import ManagedLaneAccessEgressError
 from ..logger import WranglerLogger
 from ..models._base.types import RoadwayFileTypes
 from ..models.roadway.tables import RoadLinksTable, RoadNodesTable, RoadShapesTable
-from ..utils.data import concat_with_attr
+from ..utils.data import concat_with_attr, copy_to_edit
 from .io import write_roadway
 from .links.create import copy_links, data_to_links_df
 from .links.edit import _initialize_links_as_managed_lanes
@@ -254,12 +254,12 @@ def _generate_ml_node_id_from_range(nodes_df, links_df, node_id_range: tuple[int
 
 def _generate_ml_link_id_lookup_from_scalar(links_df: DataFrame[RoadLinksTable], scalar: int):
     """Generate a lookup from general purpose link ids to their managed lane counterparts."""
-    og_ml_link_ids = links_df.of_type.managed.model_link_id
-    link_id_list = [i + scalar for i in og_ml_link_ids]
+    og_ml_link_ids = links_df.of_type.managed.model_link_id.to_numpy()
+    link_id_list = og_ml_link_ids + scalar
     if links_df.model_link_id.isin(link_id_list).any():
         msg = f"New link ids generated by scalar {scalar} already exist. Try a different scalar."
         raise ValueError(msg)
-    return dict(zip(og_ml_link_ids, link_id_list, strict=True))
+    return dict(zip(og_ml_link_ids.tolist(), link_id_list.tolist(), strict=True))
 
 
 def _generate_ml_node_id_lookup_from_scalar(nodes_df, links_df, scalar: int):
@@ -294,14 +294,14 @@ def model_links_nodes_from_net(
     copy_cols_gp_ml = list(
         set(COPY_FROM_GP_TO_ML + net.config.MODEL_ROADWAY.ADDITIONAL_COPY_FROM_GP_TO_ML)
     )
-    _m_links_df = _separate_ml_links(
+    ml_links_df, gp_links_df, no_ml_links_df = _separate_ml_links(
         net.links_df,
         ml_link_id_lookup,
         ml_node_id_lookup,
         offset_meters=net.config.MODEL_ROADWAY.ML_OFFSET_METERS,
         copy_from_gp_to_ml=copy_cols_gp_ml,
     )
-    _m_nodes_df = _create_ml_nodes_from_links(_m_links_df, ml_node_id_lookup)
+    _m_nodes_df = _create_ml_nodes_from_links(ml_links_df, ml_node_id_lookup)
     m_nodes_df = concat_with_attr([net.nodes_df, _m_nodes_df])
 
     copy_ae_fields = list(
@@ -314,7 +314,10 @@ def model_links_nodes_from_net(
         ml_node_id_lookup,
         copy_fields=copy_ae_fields,
     )
-    m_links_df = concat_with_attr([_m_links_df, _access_egress_links_df])
+    # concatenate every type of model link at once rather than growing the table in steps
+    m_links_df = concat_with_attr(
+        [ml_links_df, gp_links_df, no_ml_links_df, _access_egress_links_df]
+    )
     return m_links_df, m_nodes_df
 
 
@@ -324,9 +327,14 @@ def _separate_ml_links(
     node_id_lookup: dict[int, int],
     offset_meters: float = DefaultConfig.MODEL_ROADWAY.ML_OFFSET_METERS,
     copy_from_gp_to_ml: list[str] = COPY_FROM_GP_TO_ML,
-) -> gpd.GeoDataFrame:
-    """Separate managed lane links from general purpose links."""
-    no_ml_links_df = copy.deepcopy(links_df.of_type.general_purpose_no_parallel_managed)
+) -> tuple[gpd.GeoDataFrame, pd.DataFrame, pd.DataFrame]:
+    """Separate managed lane links from general purpose links.
+
+    Returns:
+        tuple of separate managed lane links, their parallel general purpose links, and links
+            without a parallel managed lane.
+    """
+    no_ml_links_df = links_df.of_type.general_purpose_no_parallel_managed
     gp_links_df = _create_parallel_gp_lane_links(links_df)
     ml_links_df = _create_separate_managed_lane_links(
         links_df,
@@ -342,16 +350,14 @@ def _separate_ml_links(
         \n  separate ML: {len(ml_links_df)}"
     )
 
-    m_links_df = concat_with_attr([ml_links_df, gp_links_df, no_ml_links_df], axis=0)
-
-    return m_links_df
+    return ml_links_df, gp_links_df, no_ml_links_df
 
 
 def _create_parallel_gp_lane_links(links_df: DataFrame[RoadLinksTable]) -> pd.DataFrame:
     """Create df with parallel general purpose lane links."""
     ml_properties = filter_link_properties_managed_lanes(links_df)
     keep_c = [c for c in links_df.columns if c not in ml_properties]
-    gp_links_df = copy.deepcopy(links_df[keep_c].of_type.managed)
+    gp_links_df = copy_to_edit(links_df[keep_c].of_type.managed)
     gp_links_df["managed"] = -1
     return gp_links_df
 
@@ -435,8 +441,8 @@ def _create_dummy_connector_links(
 
     # 2 - Create access and egress link dataframes from aligned records
     # if ML_access_point is specified, only have access at those points. Same for egress.
-    access_df = copy.deepcopy(filter_links_to_ml_access_points(links_df)[keep_cols])
-    egress_df = copy.deepcopy(filter_links_to_ml_egress_points(links_df)[keep_cols])
+    access_df = filter_links_to_ml_access_points(links_df)[keep_cols]
+    egress_df = filter_links_to_ml_egress_points(links_df)[keep_cols]
 
     if len(access_df) == 0:
         msg = "No access points to managed lanes found."
@@ -445,26 +451,23 @@ def _create_dummy_connector_links(
         msg = "No egress points to managed lanes found."
         raise ManagedLaneAccessEgressError(msg)
 
-    # access link should go from A_GP to A_ML
-    access_df["B"] = access_df["A"].map(ml_node_id_lookup)
-    access_df["GP_model_link_id"] = access_df["model_link_id"]
-    access_df["model_link_id"] = 1000 + access_df["GP_model_link_id"].map(ml_link_id_lookup)
-    access_df["name"] = "Access Dummy " + access_df["name"]
-    access_df["roadway"] = "ml_access_point"
-    access_df["model_link_id_idx"] = access_df["model_link_id"]
-    access_df.set_index("model_link_id_idx", inplace=True)
-
-    # egress link should go from B_ML to B_GP
-    egress_df["A"] = egress_df["B"].map(ml_node_id_lookup)
-    egress_df["GP_model_link_id"] = egress_df["model_link_id"]
-    egress_df["model_link_id"] = 2000 + egress_df["GP_model_link_id"].map(ml_link_id_lookup)
-    egress_df["name"] = "Egress Dummy " + egress_df["name"]
-    egress_df["roadway"] = "ml_egress_point"
-    egress_df["model_link_id_idx"] = egress_df["model_link_id"]
-    egress_df.set_index("model_link_id_idx", inplace=True)
-
-    # combine to one dataframe
+    # combine to one dataframe and set the access and egress specific values column-wise
     access_egress_df = concat_with_attr([access_df, egress_df], axis=0)
+    is_access = np.arange(len(access_egress_df)) < len(access_df)
+
+    # access link should go from A_GP to A_ML; egress link should go from B_ML to B_GP
+    ml_node = access_egress_df["A"].where(is_access, access_egress_df["B"]).map(ml_node_id_lookup)
+    access_egress_df["A"] = access_egress_df["A"].where(is_access, ml_node)
+    access_egress_df["B"] = ml_node.where(is_access, access_egress_df["B"])
+    access_egress_df["GP_model_link_id"] = access_egress_df["model_link_id"]
+    access_egress_df["model_link_id"] = np.where(is_access, 1000, 2000) + access_egress_df[
+        "GP_model_link_id"
+    ].map(ml_link_id_lookup)
+    access_egress_df["name"] = (
+        np.where(is_access, "Access Dummy ", "Egress Dummy ") + access_egress_df["name"]
+    )
+    access_egress_df["roadway"] = np.where(is_access, "ml_access_point", "ml_egress_point")
+    access_egress_df.index = pd.Index(access_egress_df["model_link_id"], name="model_link_id_idx")
 
     # 3 - Determine property values
     access_egress_df["lanes"] = 1
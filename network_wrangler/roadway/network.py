@@ -27,7 +27,7 @@ import geopandas as gpd
 import networkx as nx
 import pandas as pd
 from projectcard import ProjectCard, SubProject
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator, model_validator
 from shapely.geometry import LineString, Point
 from shapely.ops import split
 
@@ -46,7 +46,7 @@ from ..models.projects.roadway_selection import SelectFacility, SelectLinksDict,
 from ..models.roadway.tables import RoadLinksTable, RoadNodesAttrs, RoadNodesTable, RoadShapesTable
 from ..params import DEFAULT_CATEGORY, DEFAULT_TIMESPAN, LAT_LON_CRS
 from ..utils.data import concat_with_attr
-from ..utils.models import empty_df_from_datamodel, validate_df_to_model
+from ..utils.models import validate_df_to_model
 from .links.create import data_to_links_df
 from .links.delete import delete_links_by_ids
 from .links.edit import edit_link_geometry_from_nodes
@@ -74,7 +74,7 @@ from .selection import (
 from .shapes.create import df_to_shapes_df
 from .shapes.delete import delete_shapes_by_ids
 from .shapes.edit import edit_shape_geometry_from_nodes
-from .shapes.io import read_shapes
+from .shapes.io import _empty_shapes_df, read_shapes
 
 if TYPE_CHECKING:
     from networkx import MultiDiGraph
@@ -89,6 +89,57 @@ Selections = RoadwayLinkSelection | RoadwayNodeSelection
 MIN_SPLIT_SEGMENTS = 2
 
 
+def _tables_validated(info: ValidationInfo) -> bool:
+    """True if the validation context says the tables were already validated by the caller."""
+    return bool(info.context and info.context.get("tables_validated"))
+
+
+def _apply_property_change_to_roadway(
+    net: RoadwayNetwork,
+    change: ProjectCard | SubProject,
+    transit_net: TransitNetwork | None = None,  # noqa: ARG001
+) -> RoadwayNetwork:
+    return apply_roadway_property_change(
+        net,
+        net.get_selection(change.roadway_property_change["facility"]),
+        change.roadway_property_change["property_changes"],
+        project_name=change.project,
+    )
+
+
+def _apply_addition_to_roadway(
+    net: RoadwayNetwork,
+    change: ProjectCard | SubProject,
+    transit_net: TransitNetwork | None = None,  # noqa: ARG001
+) -> RoadwayNetwork:
+    return apply_new_roadway(net, change.roadway_addition, project_name=change.project)
+
+
+def _apply_deletion_to_roadway(
+    net: RoadwayNetwork,
+    change: ProjectCard | SubProject,
+    transit_net: TransitNetwork | None = None,
+) -> RoadwayNetwork:
+    return apply_roadway_deletion(net, change.roadway_deletion, transit_net=transit_net)
+
+
+def _apply_pycode_to_roadway(
+    net: RoadwayNetwork,
+    change: ProjectCard | SubProject,
+    transit_net: TransitNetwork | None = None,  # noqa: ARG001
+) -> RoadwayNetwork:
+    return apply_calculated_roadway(net, change.pycode)
+
+
+# Maps a project card change type to the function that applies it to a RoadwayNetwork.
+ROADWAY_CHANGE_APPLIERS = {
+    "roadway_property_change": _apply_property_change_to_roadway,
+    "roadway_addition": _apply_addition_to_roadway,
+    "roadway_deletion": _apply_deletion_to_roadway,
+    "pycode": _apply_pycode_to_roadway,
+}
+
+
 class RoadwayNetwork(BaseModel):
     """Representation of a Roadway Network.
 
@@ -182,6 +233,25 @@ class RoadwayNetwork(BaseModel):
         my_str += f"\nlinks_df (type={type(self.links_df)}):\n{self.links_df}"
         return my_str
 
+    def __deepcopy__(self, memo):
+        """Returns copied RoadwayNetwork with deep copies of its tables but not its caches.
+
+        Stored selections and modal graphs are lazily rebuilt from the copied tables when next
+        requested, so they are reset rather than deep copied.
+        """
+        RESET_NOT_COPY = ["_selections", "_modal_graphs"]
+        copied_net = self.model_copy()
+        # Register the copy first so that objects referencing this network (i.e. model_net)
+        # point to the copy rather than to a second copy.
+        memo[id(self)] = copied_net
+        copied_net.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        for attr_name, attr_value in self.__pydantic_private__.items():
+            if attr_name not in RESET_NOT_COPY:
+                setattr(copied_net, attr_name, copy.deepcopy(attr_value, memo))
+        copied_net._selections = {}
+        copied_net._modal_graphs = defaultdict(lambda: {"graph": None, "hash": None})
+        return copied_net
+
     @field_validator("config")
     @classmethod
     def validate_config(cls, v):
@@ -190,9 +260,14 @@ class RoadwayNetwork(BaseModel):
 
     @field_validator("nodes_df", mode="before")
     @classmethod
-    def validate_nodes_df(cls, v):
-        """Validate nodes_df to RoadNodesTable and coerce CRS."""
-        v = validate_df_to_model(v, RoadNodesTable)
+    def validate_nodes_df(cls, v, info: ValidationInfo):
+        """Validate nodes_df to RoadNodesTable and coerce CRS.
+
+        Table validation is skipped if the validation context has `tables_validated` set to True,
+        which is used by loaders that have already validated the table.
+        """
+        if not _tables_validated(info):
+            v = validate_df_to_model(v, RoadNodesTable)
         if hasattr(v, "crs") and v.crs != LAT_LON_CRS:
             WranglerLogger.warning(
                 f"CRS of nodes_df ({v.crs}) doesn't match network crs {LAT_LON_CRS}. \
@@ -203,9 +278,14 @@ class RoadwayNetwork(BaseModel):
 
     @field_validator("links_df", mode="before")
     @classmethod
-    def validate_links_df(cls, v):
-        """Validate links_df to RoadLinksTable and coerce CRS."""
-        v = validate_df_to_model(v, RoadLinksTable)
+    def validate_links_df(cls, v, info: ValidationInfo):
+        """Validate links_df to RoadLinksTable and coerce CRS.
+
+        Table validation is skipped if the validation context has `tables_validated` set to True,
+        which is used by loaders that have already validated the table.
+        """
+        if not _tables_validated(info):
+            v = validate_df_to_model(v, RoadLinksTable)
         if hasattr(v, "crs") and v.crs != LAT_LON_CRS:
             WranglerLogger.warning(
                 f"CRS of links_df ({v.crs}) doesn't match network crs {LAT_LON_CRS}. \
@@ -245,8 +325,7 @@ class RoadwayNetwork(BaseModel):
             )
         # if there is NONE, then at least create an empty dataframe with right schema
         elif self._shapes_df is None:
-            self._shapes_df = empty_df_from_datamodel(RoadShapesTable)
-            self._shapes_df.set_index("shape_id_idx", inplace=True)
+            self._shapes_df = _empty_shapes_df().copy()
 
         return self._shapes_df
 
@@ -371,11 +450,6 @@ class RoadwayNetwork(BaseModel):
             selection_dict (dict): SelectFacility dictionary.
             overwrite: if True, will overwrite any previously cached searches. Defaults to False.
         """
-        key = _create_selection_key(selection_dict)
-        if (key in self._selections) and not overwrite:
-            WranglerLogger.debug(f"Using cached selection from key: {key}")
-            return self._selections[key]
-
         if isinstance(selection_dict, SelectFacility):
             selection_data = selection_dict
         elif isinstance(selection_dict, SelectLinksDict):
@@ -391,14 +465,28 @@ class RoadwayNetwork(BaseModel):
             )
             raise SelectionError(msg)
 
+        # key on the parsed selection so equivalent dicts and models share a cached selection
+        key = _create_selection_key(selection_data)
+        if (key in self._selections) and not overwrite:
+            WranglerLogger.debug(f"Using cached selection from key: {key}")
+            return self._selections[key]
+
         WranglerLogger.debug(f"Getting selection from key: {key}  selection_data={selection_data}")
+        # pass the already-parsed SelectFacility so it isn't re-validated by the selection
+        selection: Selections
         if "links" in selection_data.fields:
-            return RoadwayLinkSelection(self, selection_dict)
-        if "nodes" in selection_data.fields:
-            return RoadwayNodeSelection(self, selection_dict)
-        msg = "Selection data should have either 'links' or 'nodes'."
-        WranglerLogger.error(msg + f" Received: {selection_dict}")
-        raise SelectionError(msg)
+            selection = RoadwayLinkSelection(self, selection_data)
+        elif "nodes" in selection_data.fields:
+            selection = RoadwayNodeSelection(self, selection_data)
+        else:
+            msg = "Selection data should have either 'links' or 'nodes'."
+            WranglerLogger.error(msg + f" Received: {selection_dict}")
+            raise SelectionError(msg)
+
+        # selections re-evaluate themselves when the network's modification_version changes,
+        # so they are safe to keep around and reuse.
+        self._selections[key] = selection
+        return selection
 
     def modal_graph_hash(self, mode) -> str:
         """Hash of the links in order to detect a network change from when graph created.
@@ -467,33 +555,13 @@ class RoadwayNetwork(BaseModel):
         if not isinstance(change, SubProject):
             WranglerLogger.info(f"Applying Project to Roadway Network: {change.project}")
 
-        if change.change_type == "roadway_property_change":
-            return apply_roadway_property_change(
-                self,
-                self.get_selection(change.roadway_property_change["facility"]),
-                change.roadway_property_change["property_changes"],
-                project_name=change.project,
-            )
-
-        if change.change_type == "roadway_addition":
-            return apply_new_roadway(
-                self,
-                change.roadway_addition,
-                project_name=change.project,
-            )
-
-        if change.change_type == "roadway_deletion":
-            return apply_roadway_deletion(
-                self,
-                change.roadway_deletion,
-                transit_net=transit_net,
-            )
-
-        if change.change_type == "pycode":
-            return apply_calculated_roadway(self, change.pycode)
-        WranglerLogger.error(f"Couldn't find project in: \n{change.__dict__}")
-        msg = f"Invalid Project Card Category: {change.change_type}"
-        raise ProjectCardError(msg)
+        change_type = change.change_type
+        apply_func = ROADWAY_CHANGE_APPLIERS.get(change_type)
+        if apply_func is None:
+            WranglerLogger.error(f"Couldn't find project in: \n{change.__dict__}")
+            msg = f"Invalid Project Card Category: {change_type}"
+            raise ProjectCardError(msg)
+        return apply_func(self, change, transit_net=transit_net)
 
     def links_with_link_ids(self, link_ids: list[int]) -> pd.DataFrame:
         """Return subset of links_df based on link_ids list."""
@@ -509,13 +577,14 @@ class RoadwayNetwork(BaseModel):
 
     def node_coords(self, model_node_id: int) -> tuple:
         """Return coordinates (x, y) of a node based on model_node_id."""
-        try:
-            node = self.nodes_df[self.nodes_df.model_node_id == model_node_id]
-        except ValueError as err:
+        # nodes_df is indexed by a copy of model_node_id, so use the index's hash lookup
+        # rather than scanning the model_node_id column.
+        if not self.has_node(model_node_id):
             msg = f"Node with model_node_id {model_node_id} not found."
             WranglerLogger.error(msg)
-            raise NodeNotFoundError(msg) from err
-        return node.geometry.x.values[0], node.geometry.y.values[0]
+            raise NodeNotFoundError(msg)
+        point = self.nodes_df.geometry.loc[model_node_id]
+        return point.x, point.y
 
     def add_links(
         self,
@@ -556,8 +625,9 @@ class RoadwayNetwork(BaseModel):
             add_nodes_df: Dataframe of additional nodes to add.
             in_crs: crs of input data. Defaults to LAT_LON_CRS.
         """
-        dupe_ids = self.nodes_df.model_node_id.isin(add_nodes_df.model_node_id)
-        if dupe_ids.any():
+        dupe_recs = self.nodes_df.model_node_id.isin(add_nodes_df.model_node_id)
+        if dupe_recs.any():
+            dupe_ids = self.nodes_df.loc[dupe_recs, "model_node_id"]
             WranglerLogger.error(
                 f"Cannot add nodes with model_node_id already in network: {dupe_ids}"
             )
@@ -566,9 +636,11 @@ class RoadwayNetwork(BaseModel):
         WranglerLogger.debug(f"add_nodes(): self.nodes_df.tail()\n{self.nodes_df.tail()}")
         WranglerLogger.debug(f"add_nodes(): add_nodes_df:\n{add_nodes_df}")
 
-        # this will perform validation to the nodes schema
-        self.nodes_df = data_to_nodes_df(
-            nodes_df=concat_with_attr([self.nodes_df, add_nodes_df], axis=0), in_crs=in_crs
+        # only the added nodes need geometry and X/Y processing; existing nodes already have it
+        if add_nodes_df.attrs.get("name") != "road_nodes":
+            add_nodes_df = data_to_nodes_df(add_nodes_df, in_crs=in_crs)
+        self.nodes_df = validate_df_to_model(
+            concat_with_attr([self.nodes_df, add_nodes_df], axis=0), RoadNodesTable
         )
         # Ensure attrs are preserved after validation
         self.nodes_df.attrs.update(RoadNodesAttrs)
@@ -642,7 +714,7 @@ class RoadwayNetwork(BaseModel):
             raise SelectionError(msg)
         if clean_nodes:
             node_ids_to_delete = node_ids_unique_to_link_ids(
-                selection.selected_links, selection.selected_links_df, self.nodes_df
+                selection.selected_links, self.links_df, self.nodes_df
             )
             WranglerLogger.debug(
                 f"Dropping nodes associated with dropped links: \n{node_ids_to_delete}"
@@ -651,7 +723,7 @@ class RoadwayNetwork(BaseModel):
 
         if clean_shapes:
             shape_ids_to_delete = shape_ids_unique_to_link_ids(
-                selection.selected_links, selection.selected_links_df, self.shapes_df
+                selection.selected_links, self.links_df, self.shapes_df
             )
             WranglerLogger.debug(
                 f"Dropping shapes associated with dropped links: \n{shape_ids_to_delete}"
@@ -991,9 +1063,7 @@ class RoadwayNetwork(BaseModel):
         Args:
             model_node_id: model_node_id to check for.
         """
-        has_node = self.nodes_df[self.nodes_df.model_node_id].isin([model_node_id]).any()
-
-        return has_node
+        return model_node_id in self.nodes_df.index
 
     def has_link(self, ab: tuple) -> bool:
         """Returns true if network has links with AB values.
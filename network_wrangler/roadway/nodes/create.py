@@ -1,10 +1,10 @@
 """Functions for creating nodes from data sources."""
 
-import copy
 import time
 
 import geopandas as gpd
 import pandas as pd
+import shapely
 from pandera.typing import DataFrame
 from pydantic import validate_call
 
@@ -13,7 +13,7 @@ from ...errors import NodeAddError
 from ...logger import WranglerLogger
 from ...models.roadway.tables import RoadLinksTable, RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS, SMALL_RECS
-from ...utils.geo import get_point_geometry_from_linestring, point_from_xy
+from ...utils.geo import point_series_from_xy
 from ...utils.models import validate_df_to_model
 from ..utils import set_df_index_to_pk
 
@@ -44,23 +44,21 @@ def _create_node_geometries_from_xy(
     if "geometry" in nodes_df:
         mask = nodes_df["geometry"].isna()
         if mask.any():
-            nodes_df.loc[mask, "geometry"] = nodes_df.loc[mask].apply(
-                lambda x: point_from_xy(x["X"], x["Y"], xy_crs=in_crs, point_crs=net_crs),
-                axis=1,
+            nodes_df.loc[mask, "geometry"] = point_series_from_xy(
+                nodes_df.loc[mask, "X"], nodes_df.loc[mask, "Y"], xy_crs=in_crs, point_crs=net_crs
             )
         WranglerLogger.debug(
             f"Filled missing geometry from X and Y in {round(time.time() - geo_start_time, 2)}."
         )
         return nodes_df
 
-    node_geometries = nodes_df.apply(
-        lambda x: point_from_xy(x["X"], x["Y"], xy_crs=in_crs, point_crs=net_crs),
-        axis=1,
+    node_geometries = point_series_from_xy(
+        nodes_df["X"], nodes_df["Y"], xy_crs=in_crs, point_crs=net_crs
     )
     WranglerLogger.debug(
         f"Created node geometries from X and Y in {round(time.time() - geo_start_time, 2)}."
     )
-    nodes_gdf = gpd.GeoDataFrame(nodes_df, geometry=node_geometries, crs=in_crs)
+    nodes_gdf = gpd.GeoDataFrame(nodes_df, geometry=node_geometries, crs=net_crs)
     return nodes_gdf
 
 
@@ -98,8 +96,8 @@ def data_to_nodes_df(
         nodes_df = _create_node_geometries_from_xy(nodes_df, in_crs=in_crs, net_crs=LAT_LON_CRS)
 
     # Make sure values are consistent
-    nodes_df["X"] = nodes_df["geometry"].apply(lambda g: g.x)
-    nodes_df["Y"] = nodes_df["geometry"].apply(lambda g: g.y)
+    nodes_df["X"] = shapely.get_x(nodes_df["geometry"].values)
+    nodes_df["Y"] = shapely.get_y(nodes_df["geometry"].values)
 
     if len(nodes_df) < SMALL_RECS:
         WranglerLogger.debug(f"nodes_df: \n{nodes_df[['model_node_id', 'geometry', 'X', 'Y']]}")
@@ -131,17 +129,23 @@ def _create_nodes_from_link(
     Returns:
         DataFrame[RoadNodesTable]
     """
-    nodes_df = copy.deepcopy(links_df[[node_key_field, "geometry"]].drop_duplicates())
-
-    nodes_df = nodes_df.rename(columns={node_key_field: "model_node_id"})
-
-    nodes_df["geometry"] = nodes_df["geometry"].apply(
-        get_point_geometry_from_linestring, pos=link_pos
+    _first_link_with_node = ~links_df[node_key_field].duplicated()
+    _node_links_df = links_df.loc[_first_link_with_node, [node_key_field, "geometry"]]
+
+    # get the node points from all of the link geometries at once
+    node_points = shapely.get_point(_node_links_df["geometry"].values, link_pos)
+    model_node_ids = _node_links_df[node_key_field].to_numpy()
+    nodes_df = gpd.GeoDataFrame(
+        {
+            "model_node_id": model_node_ids,
+            "geometry": node_points,
+            "X": shapely.get_x(node_points),
+            "Y": shapely.get_y(node_points),
+        },
+        index=pd.Index(model_node_ids, name="model_node_id_idx"),
+        geometry="geometry",
+        crs=links_df.crs,
     )
-    nodes_df["X"] = nodes_df.geometry.x
-    nodes_df["Y"] = nodes_df.geometry.y
-    nodes_df["model_node_id_idx"] = nodes_df["model_node_id"]
-    nodes_df.set_index("model_node_id_idx", inplace=True)
     nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
     # WranglerLogger.debug(f"ct3: nodes_df:\n{nodes_df}")
     return nodes_df
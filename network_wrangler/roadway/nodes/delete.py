@@ -20,7 +20,8 @@ def delete_nodes_by_ids(
     """
     WranglerLogger.debug(f"Deleting nodse with ids: \n{del_node_ids}")
 
-    _missing = set(del_node_ids) - set(nodes_df.index)
+    # look ids up in the index rather than building a set of every id in the table
+    _missing = {i for i in del_node_ids if i not in nodes_df.index}
     if _missing:
         msg = "Nodes to delete are not in the network."
         WranglerLogger.warning(msg + f"\n{_missing}")
@@ -4,8 +4,6 @@ NOTE: Each public method will return a new, whole copy of the RoadNodesTable wit
 Private methods may return mutated originals.
 """
 
-import copy
-
 import geopandas as gpd
 from pandera import Field
 from pandera.api.pandas.model import DataFrameModel
@@ -19,7 +17,7 @@ from ...models._base.records import RecordModel
 from ...models.projects.roadway_changes import RoadPropertyChange
 from ...models.roadway.tables import RoadNodesAttrs, RoadNodesTable
 from ...params import LAT_LON_CRS
-from ...utils.data import update_df_by_col_value, validate_existing_value_in_df
+from ...utils.data import copy_to_edit, update_df_by_col_value, validate_existing_value_in_df
 from ...utils.models import validate_call_pyd, validate_df_to_model
 
 
@@ -135,7 +133,7 @@ def edit_node_property(
     ):
         return nodes_df
 
-    nodes_df = copy.deepcopy(nodes_df)
+    nodes_df = copy_to_edit(nodes_df)
 
     # if it is a new attribute then initialize with NaN values
     if prop_name not in nodes_df:
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from pandera.typing import DataFrame
 
 from ...logger import WranglerLogger
+from ...models.roadway.tables import RoadNodesAttrs
+from ...utils.data import index_isin
 from ..links.links import node_ids_in_link_ids, node_ids_in_links
 
 if TYPE_CHECKING:
@@ -25,6 +27,8 @@ def filter_nodes_to_ids(
     Returns:
         pd.DataFrame: filtered nodes dataframe
     """
+    if nodes_df.index.name == RoadNodesAttrs["idx_col"]:
+        return nodes_df.loc[index_isin(nodes_df.index, node_ids)]
     return nodes_df.loc[nodes_df["model_node_id"].isin(node_ids)]
 
 
@@ -69,7 +69,6 @@ def read_nodes(
     WranglerLogger.info(
         f"Read {len(nodes_df):,} nodes from {filename} in {round(time.time() - start_time, 2)}."
     )
-    nodes_df = validate_df_to_model(nodes_df, RoadNodesTable)
     return nodes_df
 
 
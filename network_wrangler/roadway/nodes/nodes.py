@@ -16,5 +16,4 @@ def node_ids_without_links(
         links_df (DataFrame[RoadLinksTable]): links table
     """
     _node_ids_in_links = node_ids_in_links(links_df)
-    _node_idx_in_links = nodes_df[nodes_df["model_node_id"].isin(_node_ids_in_links)].index
-    return list(set(nodes_df.index) - set(_node_idx_in_links))
+    return nodes_df.index[~nodes_df["model_node_id"].isin(_node_ids_in_links)].tolist()
@@ -27,14 +27,17 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+import shapely
 from pandera.typing import DataFrame
 
 from ..errors import SegmentFormatError, SegmentSelectionError, SubnetCreationError
 from ..logger import WranglerLogger
 from ..models.projects.roadway_selection import SelectNodeDict
 from ..params import DEFAULT_SEARCH_MODES
+from ..utils.data import copy_to_edit
 from .graph import shortest_path
 from .links.filters import filter_links_to_path
+from .nodes.filters import filter_nodes_to_ids
 from .subnet import Subnet
 
 if TYPE_CHECKING:
@@ -122,6 +125,10 @@ class Segment:
 
         # segment members are identified by storing nodes along a route
         self._segment_nodes: list | None = None
+        self._segment_nodes_df: DataFrame[RoadNodesTable] | None = None
+        self._segment_nodes_key: tuple | None = None
+        self._segment_links_df: DataFrame[RoadLinksTable] | None = None
+        self._segment_links_key: tuple | None = None
 
         # Initialize calculated, read-only attr.
         self._from_node_id: int | None = None
@@ -168,10 +175,23 @@ class Segment:
             raise SegmentSelectionError(msg)
         return self._segment_nodes
 
+    @property
+    def _segment_cache_key(self) -> tuple:
+        """Network version and path that cached segment tables are valid for."""
+        return (self.net.modification_version, tuple(self.segment_nodes))
+
     @property
     def segment_nodes_df(self) -> DataFrame[RoadNodesTable]:
-        """Roadway network nodes filtered to nodes in segment."""
-        return self.net.nodes_df.loc[self.segment_nodes]
+        """Roadway network nodes filtered to nodes in segment.
+
+        Cached until the network or the segment path changes because the segment start and end
+        nodes are read from it.
+        """
+        cache_key = self._segment_cache_key
+        if self._segment_nodes_df is None or self._segment_nodes_key != cache_key:
+            self._segment_nodes_df = self.net.nodes_df.loc[self.segment_nodes]
+            self._segment_nodes_key = cache_key
+        return self._segment_nodes_df
 
     @property
     def segment_from_node_s(self) -> DataFrame[RoadNodesTable]:
@@ -185,10 +205,19 @@ class Segment:
 
     @property
     def segment_links_df(self) -> DataFrame[RoadLinksTable]:
-        """Roadway network links filtered to segment links."""
-        modal_links_df = self.net.links_df.mode_query(self.modes)
-        segment_links_df = filter_links_to_path(modal_links_df, self.segment_nodes)
-        return segment_links_df
+        """Roadway network links filtered to segment links.
+
+        Cached until the network or the segment path changes.
+        """
+        cache_key = self._segment_cache_key
+        if self._segment_links_df is None or self._segment_links_key != cache_key:
+            links_df, segment_nodes = self.net.links_df, self.segment_nodes
+            # only links starting at a segment node can be on the path, so mode filter just those
+            path_a_links_df = links_df.loc[links_df["A"].isin(segment_nodes)]
+            modal_links_df = path_a_links_df.mode_query(self.modes)
+            self._segment_links_df = filter_links_to_path(modal_links_df, segment_nodes)
+            self._segment_links_key = cache_key
+        return self._segment_links_df
 
     @property
     def segment_links(self) -> list[int]:
@@ -205,9 +234,14 @@ class Segment:
         node_selection_dict = {
             k: v
             for k, v in node_selection_data.asdict.items()
-            if k in self.selection.node_query_fields
+            if k in self.selection.node_query_fields and v is not None
         }
-        node_df = self.net.nodes_df.isin_dict(node_selection_dict)
+        if node_selection_dict.keys() == {"model_node_id"}:
+            # look the primary key up in the index instead of merging against every node
+            node_ids = [node_selection_dict["model_node_id"]]
+            node_df = filter_nodes_to_ids(self.net.nodes_df, node_ids)
+        else:
+            node_df = self.net.nodes_df.isin_dict(node_selection_dict)
         if len(node_df) != 1:
             msg = f"Node selection not unique. Found {len(node_df)} nodes."
             raise SegmentSelectionError(msg)
@@ -255,7 +289,7 @@ class Segment:
     def _find_subnet_shortest_path(
         self,
     ) -> bool:
-        """Finds shortest path from from_node_id to to_node_id using self.subnet.graph.
+        """Finds shortest path from from_node_id to to_node_id using self.subnet.sp_graph.
 
         Sets self._segment_nodes to resulting path nodes
 
@@ -267,7 +301,9 @@ class Segment:
         {self.subnet._sp_weight_col} as weight with a factor of {self.subnet._sp_weight_factor}"
         )
 
-        self._segment_nodes = shortest_path(self.subnet.graph, self.from_node_id, self.to_node_id)
+        self._segment_nodes = shortest_path(
+            self.subnet.sp_graph, self.from_node_id, self.to_node_id
+        )
 
         if not self._segment_nodes:
             WranglerLogger.debug(f"No SP from {self.from_node_id} to {self.to_node_id} Found.")
@@ -337,7 +373,7 @@ def generate_subnet_from_link_selection_dict(
     link_sd_options = _generate_subnet_link_selection_dict_options(link_selection_dict)
     for sd in link_sd_options:
         WranglerLogger.debug(f"Trying link selection:\n{sd}")
-        subnet_links_df = copy.deepcopy(net.links_df.mode_query(modes))
+        subnet_links_df = copy_to_edit(net.links_df.mode_query(modes))
         subnet_links_df = subnet_links_df.dict_query(sd)
         if len(subnet_links_df) > 0:
             break
@@ -388,9 +424,9 @@ def identify_segment_endpoints(
     REF_PER_NODE = 2
 
     # make a copy so it is a full dataframe rather than a slice.
-    _links_df = copy.deepcopy(net.links_df.mode_query(mode))
+    _links_df = copy_to_edit(net.links_df.mode_query(mode))
 
-    _nodes_df = copy.deepcopy(
+    _nodes_df = copy_to_edit(
         net.nodes_in_links(
             _links_df,
         )
@@ -406,7 +442,12 @@ def identify_segment_endpoints(
     # WranglerLogger.debug(f"Node/Link table elements: {len(_nodes_df)}"")
 
     # Screen out segments that have blank name AND refs
-    _nodes_df = _nodes_df.replace(r"^\s*$", np.nan, regex=True).dropna(subset=["name", "ref"])
+    _has_name_and_ref = np.logical_and.reduce(
+        [_nodes_df[c].fillna("").str.strip() != "" for c in SEGMENT_IDENTIFIERS]
+    )
+    _nodes_df = _nodes_df.loc[_has_name_and_ref]
+    # name and ref are grouped on repeatedly below; categories group on integer codes
+    _nodes_df[SEGMENT_IDENTIFIERS] = _nodes_df[SEGMENT_IDENTIFIERS].astype("category")
 
     # WranglerLogger.debug(f"Node/Link recs after dropping empty name AND ref : {len(_nodes_df)}")
 
@@ -415,8 +456,8 @@ def identify_segment_endpoints(
     _min_ref_in_table = REF_PER_NODE * (min_connecting_links - max_link_deviation)
     _min_name_in_table = NAME_PER_NODE * (min_connecting_links - max_link_deviation)
 
-    _nodes_df["ref_freq"] = _nodes_df["ref"].map(_nodes_df["ref"].value_counts())
-    _nodes_df["name_freq"] = _nodes_df["name"].map(_nodes_df["name"].value_counts())
+    _nodes_df["ref_freq"] = _nodes_df.groupby("ref", observed=True)["ref"].transform("size")
+    _nodes_df["name_freq"] = _nodes_df.groupby("name", observed=True)["name"].transform("size")
 
     _nodes_df = _nodes_df.loc[
         (_nodes_df["ref_freq"] >= _min_ref_in_table)
@@ -443,18 +484,16 @@ def identify_segment_endpoints(
     _max_ref_endpoints = REF_PER_NODE / 2
     _max_name_endpoints = NAME_PER_NODE / 2
     # - Attach frequency  of node/ref
-    _nodes_df = _nodes_df.merge(
-        _nodes_df.groupby(by=[net.nodes_df.model_node_id, "ref"]).size().rename("ref_N_freq"),
-        on=[net.nodes_df.model_node_id, "ref"],
-    )
+    _nodes_df["ref_N_freq"] = _nodes_df.groupby(["model_node_id", "ref"], observed=True)[
+        "model_node_id"
+    ].transform("size")
 
     _display_cols = ["model_node_id", "ref", "name", "ref_N_freq"]
     # WranglerLogger.debug(f"_ref_count+_nodes:\n{_nodes_df[_display_cols]})
     # - Attach frequency  of node/name
-    _nodes_df = _nodes_df.merge(
-        _nodes_df.groupby(by=[net.nodes_df.model_node_id, "name"]).size().rename("name_N_freq"),
-        on=[net.nodes_df.model_node_id, "name"],
-    )
+    _nodes_df["name_N_freq"] = _nodes_df.groupby(["model_node_id", "name"], observed=True)[
+        "model_node_id"
+    ].transform("size")
     _display_cols = ["model_node_id", "ref", "name", "name_N_freq"]
     # WranglerLogger.debug(f"_name_count+_nodes:\n{_nodes_df[_display_cols]}")
 
@@ -486,9 +525,9 @@ def identify_segment_endpoints(
     # ----------------------------------------
     # Assign a segment id
     # ----------------------------------------
-    _nodes_df["segment_id"], _segments = pd.factorize(_nodes_df.name + _nodes_df.ref)
+    _nodes_df["segment_id"], _segments = _factorize_segments(_nodes_df)
 
-    WranglerLogger.debug(f"{len(_segments)} Segments: \n{chr(10).join(_segments.tolist())}")
+    WranglerLogger.debug(f"{len(_segments)} Segments: \n{chr(10).join(_segments)}")
 
     # ----------------------------------------
     # Drop segments without at least two nodes
@@ -511,15 +550,11 @@ def identify_segment_endpoints(
     # For segments with more than two nodes, find farthest apart pairs
     # ----------------------------------------
 
-    def _max_segment_distance(row):
-        _segment_nodes = _nodes_df.loc[_nodes_df["segment_id"] == row["segment_id"]]
-        dist = _segment_nodes.geometry.distance(row.geometry)
-        return max(dist.dropna())
-
-    _nodes_df["seg_distance"] = _nodes_df.apply(_max_segment_distance, axis=1)
-    _nodes_df = _nodes_df.merge(
-        _nodes_df.groupby("segment_id").seg_distance.agg(max).rename("max_seg_distance"),
-        on="segment_id",
+    _nodes_df["seg_distance"] = _max_distance_within_segments(
+        _nodes_df.geometry.to_numpy(), _nodes_df["segment_id"].to_numpy()
+    )
+    _nodes_df["max_seg_distance"] = _nodes_df.groupby("segment_id")["seg_distance"].transform(
+        "max"
     )
 
     _nodes_df = _nodes_df.loc[
@@ -530,7 +565,7 @@ def identify_segment_endpoints(
     # ----------------------------------------
     # Reassign segment id for final segments
     # ----------------------------------------
-    _nodes_df["segment_id"], _segments = pd.factorize(_nodes_df.name + _nodes_df.ref)
+    _nodes_df["segment_id"], _segments = _factorize_segments(_nodes_df)
 
     _display_cols = [
         net.nodes_df.model_node_id,
@@ -552,3 +587,41 @@ def identify_segment_endpoints(
         "ref",
     ]
     return _nodes_df[_return_cols]
+
+
+def _factorize_segments(nodes_df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    """Segment id for each node from its name and ref, and the name + ref of each segment.
+
+    Expects categorical name and ref columns, and packs their codes into one integer per node
+    so that only integers are hashed. Nodes missing a name or ref get segment id -1, as
+    `pd.factorize` does for missing values.
+    """
+    name_codes = nodes_df["name"].cat.codes.to_numpy().astype(np.int64)
+    ref_codes = nodes_df["ref"].cat.codes.to_numpy().astype(np.int64)
+    n_refs = max(len(nodes_df["ref"].cat.categories), 1)
+    has_segment = (name_codes >= 0) & (ref_codes >= 0)
+    segment_ids = np.full(len(nodes_df), -1, dtype=np.intp)
+    segment_ids[has_segment], segment_codes = pd.factorize(
+        name_codes[has_segment] * n_refs + ref_codes[has_segment]
+    )
+    names = nodes_df["name"].cat.categories[segment_codes // n_refs]
+    refs = nodes_df["ref"].cat.categories[segment_codes % n_refs]
+    return segment_ids, [f"{name}{ref}" for name, ref in zip(names, refs, strict=True)]
+
+
+def _max_distance_within_segments(geoms: np.ndarray, segment_ids: np.ndarray) -> np.ndarray:
+    """Distance from each geometry to the farthest geometry with the same segment id.
+
+    Computes each segment's pairwise distances in one vectorized shapely call rather than
+    one call per row. Rows without a segment (id -1) or without a geometry to measure stay NaN.
+    """
+    seg_distance = np.full(len(geoms), np.nan)
+    segment_rows = pd.Series(segment_ids).groupby(segment_ids, sort=False).indices
+    for segment_id, rows in segment_rows.items():
+        if segment_id < 0:
+            continue
+        seg_geoms = geoms[rows]
+        dists = shapely.distance(seg_geoms[:, None], seg_geoms[None, :])
+        # fmax skips the NaN distances of missing geometries without warning on all-NaN rows
+        seg_distance[rows] = np.fmax.reduce(dists, axis=1)
+    return seg_distance
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, ClassVar, Literal
 
@@ -16,6 +15,7 @@ from ..models.projects import (
 )
 from ..params import DEFAULT_SEARCH_MODES, SMALL_RECS
 from ..utils.models import DatamodelDataframeIncompatableError, coerce_extra_fields_to_type_in_df
+from ..utils.utils import dict_to_hexkey
 from .links.filters import filter_links_to_modes
 from .segment import Segment
 
@@ -113,7 +113,7 @@ class RoadwaySelection(ABC):
     @property
     def sel_key(self):
         """Return the selection key as generated from `self.raw_selection_dict`."""
-        return self._sel_key
+        return self._selection_key
 
     @property
     def selection_data(self):
@@ -604,7 +604,10 @@ class RoadwayNodeSelection(RoadwaySelection):
 def _create_selection_key(
     selection_dict: SelectLinksDict | SelectNodesDict | SelectFacility | dict,
 ) -> str:
-    """Selections are stored by a sha1 hash of the bit-encoded string of the selection dictionary.
+    """Selections are stored by a sha1 hash of the key-sorted selection dictionary.
+
+    Sorting the keys means the same facility selected with its fields in a different order
+    (common across the changes in one project card) reuses the cached selection.
 
     Args:
         selection_dict: Selection Dictionary
@@ -625,4 +628,4 @@ def _create_selection_key(
         )
         msg = "Selection dictionary must be a dictionary or SelectFacility model."
         raise SelectionError(msg)
-    return hashlib.sha1(str(selection_dict).encode()).hexdigest()
+    return dict_to_hexkey(selection_dict)
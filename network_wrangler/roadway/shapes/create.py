@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import copy
-
 import geopandas as gpd
 import pandas as pd
 from pandera.typing import DataFrame
 
 from ...configs import DefaultConfig, WranglerConfig
+from ...errors import ShapeAddError
 from ...logger import WranglerLogger
 from ...models.roadway.tables import RoadShapesAttrs, RoadShapesTable
 from ...params import LAT_LON_CRS
@@ -38,6 +37,8 @@ def df_to_shapes_df(
     WranglerLogger.debug(f"Creating {len(shapes_df)} shapes.")
     if not isinstance(shapes_df, gpd.GeoDataFrame):
         shapes_df = coerce_gdf(shapes_df, in_crs=in_crs)
+    elif shapes_df.crs is None:
+        shapes_df = shapes_df.set_crs(in_crs)
 
     if shapes_df.crs != LAT_LON_CRS:
         shapes_df = shapes_df.to_crs(LAT_LON_CRS)
@@ -80,19 +81,11 @@ def create_offset_shapes(
       RoadShapesTable: of offset shapes and a column `ref_shape_id` which references
             the shape_id which was offset to create it.
     """
-    offset_shapes_df = pd.DataFrame(
-        {
-            "shape_id": generate_list_of_new_ids_from_existing(
-                shape_ids, shapes_df.shape_ids.to_list, id_scalar
-            ),
-            "ref_shape_id": shape_ids,
-        }
-    )
-
-    ref_shapes_df = copy.deepcopy(shapes_df[shapes_df["shape_id"].isin(shape_ids)])
+    # geometry is replaced wholesale below, so a shallow copy avoids cloning every geometry
+    ref_shapes_df = shapes_df.loc[shapes_df["shape_id"].isin(shape_ids)].copy(deep=False)
 
     ref_shapes_df["offset_shape_id"] = generate_list_of_new_ids_from_existing(
-        ref_shapes_df.shape_id.to_list, shapes_df.shape_ids.to_list, id_scalar
+        ref_shapes_df["shape_id"].to_list(), shapes_df["shape_id"], id_scalar
     )
 
     ref_shapes_df["geometry"] = offset_geometry_meters(ref_shapes_df.geometry, offset_dist_meters)
@@ -103,6 +96,9 @@ def create_offset_shapes(
             "offset_shape_id": "shape_id",
         }
     )
+    offset_shapes_df = offset_shapes_df.set_index(
+        pd.Index(offset_shapes_df["shape_id"], name=offset_shapes_df.attrs["idx_col"])
+    )
 
     offset_shapes_gdf = gpd.GeoDataFrame(offset_shapes_df, geometry="geometry", crs=shapes_df.crs)
 
@@ -130,6 +126,8 @@ def add_offset_shapes(
             the shape_id which was offset to create it.
     """
     offset_shapes_df = create_offset_shapes(shapes_df, shape_ids, offset_dist_meters, id_scalar)
-    shapes_df = concat_with_attr([shapes_df, offset_shapes_df])
-    shapes_df = validate_df_to_model(shapes_df, RoadShapesTable)
-    return shapes_df
+    # both tables are already validated, so only the new shape ids need checking
+    if (shapes_df.index.get_indexer(offset_shapes_df.index) >= 0).any():
+        msg = "Cannot add offset shapes with shape_id already in shapes_df."
+        raise ShapeAddError(msg)
+    return concat_with_attr([shapes_df, offset_shapes_df])
@@ -22,7 +22,8 @@ def delete_shapes_by_ids(
     """
     WranglerLogger.debug(f"Deleting shapes with ids: \n{del_shape_ids}")
 
-    _missing = set(del_shape_ids) - set(shapes_df.index)
+    # look ids up in the index rather than building a set of every id in the table
+    _missing = {i for i in del_shape_ids if i not in shapes_df.index}
     if _missing:
         WranglerLogger.warning(f"Shapes in network not there to delete: \n{_missing}")
         if not ignore_missing:
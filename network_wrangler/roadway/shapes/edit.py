@@ -6,11 +6,10 @@ Private methods may return mutated originals.
 
 from __future__ import annotations
 
-import copy
-
 from pandera.typing import DataFrame
 
 from ...models.roadway.tables import RoadLinksTable, RoadNodesTable, RoadShapesTable
+from ...utils.data import copy_to_edit
 from ...utils.geo import update_nodes_in_linestring_geometry
 
 
@@ -33,7 +32,7 @@ def edit_shape_geometry_from_nodes(
         nodes_df: RoadNodesTable
         node_ids: list of node PKs with updated geometry
     """
-    shapes_df = copy.deepcopy(shapes_df)
+    shapes_df = copy_to_edit(shapes_df)
     links_A_df = links_df.loc[links_df.A.isin(node_ids)]
     _tempshape_A_df = shapes_df[["shape_id", "geometry"]].merge(
         links_A_df[["shape_id", "A"]], on="shape_id", how="inner"
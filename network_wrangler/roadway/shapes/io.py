@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from functools import cache
 from pathlib import Path
 
 from geopandas import GeoDataFrame
@@ -22,6 +23,15 @@ from ...utils.models import (
 from .create import df_to_shapes_df
 
 
+@cache
+def _empty_shapes_df() -> DataFrame[RoadShapesTable]:
+    """Empty RoadShapesTable indexed by shape_id_idx, cached since building it runs pandera.
+
+    Callers should copy it rather than mutate the cached frame.
+    """
+    return empty_df_from_datamodel(RoadShapesTable, crs=LAT_LON_CRS).set_index("shape_id_idx")
+
+
 @validate_call_pyd
 def read_shapes(
     filename: Path,
@@ -56,19 +66,22 @@ def read_shapes(
             f"Shapes file {filename} not found, but is optional. \
                                Returning empty shapes dataframe."
         )
-        return empty_df_from_datamodel(RoadShapesTable, crs=LAT_LON_CRS).set_index(
-            "shape_id_idx", inplace=True
-        )
+        return _empty_shapes_df().copy()
 
     start_time = time.time()
     WranglerLogger.debug(f"Reading shapes from {filename}.")
 
+    filters = None
+    if filter_to_shape_ids:
+        # parquet skips other shapes while reading
+        filters = [("shape_id", "in", list(filter_to_shape_ids))]
     shapes_df = read_table(
         filename,
         boundary_gdf=boundary_gdf,
         boundary_geocode=boundary_geocode,
         boundary_file=boundary_file,
         read_speed=config.CPU.EST_PD_READ_SPEED,
+        filters=filters,
     )
     if filter_to_shape_ids:
         shapes_df = shapes_df[shapes_df["shape_id"].isin(filter_to_shape_ids)]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame
 
@@ -12,11 +13,11 @@ from ..errors import SubnetCreationError, SubnetExpansionError
 from ..logger import WranglerLogger
 from ..params import DEFAULT_SEARCH_MODES
 from ..utils.data import concat_with_attr
-from .graph import links_nodes_to_ox_graph
+from .graph import add_links_to_sp_graph, links_nodes_to_ox_graph, links_to_sp_graph
 from .links.links import node_ids_in_links
 
 if TYPE_CHECKING:
-    from networkx import MultiDiGraph
+    from networkx import DiGraph, MultiDiGraph
 
     from ..models.roadway.tables import RoadLinksTable, RoadNodesTable
     from .network import RoadwayNetwork
@@ -49,7 +50,7 @@ class Subnet:
 
     segment = Segment(net=RoadwayNetwork(...), selection_dict=selection_dict)
     # used to store graph
-    self._segment_route_nodes = shortest_path(segment.subnet.graph, start_node_pk, end_node_pk)
+    self._segment_route_nodes = shortest_path(segment.subnet.sp_graph, start_node_pk, end_node_pk)
     ```
 
     attr:
@@ -57,10 +58,11 @@ class Subnet:
         selection_dict: segment selection dictionary, which is is used to create initial subnet
             based on name and ref
         subnet_links_df: initial subnets can alternately be defined by a dataframe of links.
-        graph_hash: unique hash of subnet_links_df, _sp_weight_col and _sp_weight_factor. Used
-            to identify if any of these have changed and thus if a new graph should be generated.
+        graph_hash: unique hash of subnet_links_df, _sp_weight_col and _sp_weight_factor.
         graph: returns the nx.MultiDigraph of subne which is stored in self._graph and lazily
-            evaluated when called if graph_hash has changed becusae it is an expensive operation.
+            evaluated when called if the subnet links or weights have changed becusae it is an
+            expensive operation.
+        sp_graph: lighter nx.DiGraph of the subnet with only link weights, for shortest paths.
         num_links: number of links in the subnet
         subnet_nodes: lazily evaluated list of node primary keys based on subnet_links_df
         subnet_nodes_df: lazily evaluated selection of net.nodes_df based on subnet_links_df
@@ -105,7 +107,17 @@ class Subnet:
         self._sp_weight_factor = sp_weight_factor
         self._max_search_breadth = max_search_breadth
         self._graph = None
-        self._graph_link_hash = None
+        self._graph_key = None
+        self._sp_graph = None
+        self._sp_graph_key = None
+        self._subnet_version = 0  # incremented each time subnet links change
+        self._modal_links_df = None
+        self._node_to_modal_link_positions: dict = {}
+        self._modal_links_net_version = None
+        self._modal_a: np.ndarray | None = None
+        self._modal_b: np.ndarray | None = None
+        self._subnet_nodes = None
+        self._subnet_nodes_key = None
 
     @property
     def exists(self) -> bool:
@@ -136,18 +148,48 @@ class Subnet:
         _hash = hashlib.sha256(_enc_value).hexdigest()
         return _hash
 
+    @property
+    def _graph_key_now(self) -> tuple:
+        """Subnet links version and weight settings that the subnet graphs are built from."""
+        return (self._subnet_version, self._sp_weight_col, self._sp_weight_factor)
+
     @property
     def graph(self) -> MultiDiGraph:
-        """nx.MultiDiGraph of the subnet."""
-        if self.graph_hash != self._graph_link_hash:
+        """nx.MultiDiGraph of the subnet.
+
+        Cached until the subnet links or shortest path weight settings change. Uses a version
+        counter rather than `graph_hash` to detect changes because hashing the links is
+        expensive.
+        """
+        _graph_key = self._graph_key_now
+        if self._graph is None or _graph_key != self._graph_key:
             self._graph = links_nodes_to_ox_graph(
                 self.subnet_links_df,
                 self.subnet_nodes_df,
                 sp_weight_col=self._sp_weight_col,
                 sp_weight_factor=self._sp_weight_factor,
             )
+            self._graph_key = _graph_key
         return self._graph
 
+    @property
+    def sp_graph(self) -> DiGraph:
+        """nx.DiGraph of the subnet with only the weights needed to find shortest paths.
+
+        Cached the same way as `graph`, but much cheaper to build because it doesn't carry link
+        attributes or geometry. Subnet expansions add their links to it rather than rebuilding it.
+        """
+        _sp_graph_key = self._graph_key_now
+        if self._sp_graph is None or _sp_graph_key != self._sp_graph_key:
+            self._sp_graph = links_to_sp_graph(
+                self.subnet_links_df,
+                self.subnet_nodes_df,
+                sp_weight_col=self._sp_weight_col,
+                sp_weight_factor=self._sp_weight_factor,
+            )
+            self._sp_graph_key = _sp_graph_key
+        return self._sp_graph
+
     @property
     def num_links(self):
         """Number of links in the subnet."""
@@ -155,11 +197,19 @@ class Subnet:
 
     @property
     def subnet_nodes(self) -> pd.Series:
-        """List of node_ids in the subnet."""
+        """List of node_ids in the subnet.
+
+        Cached until the subnet links or the network change because it is accessed several
+        times per subnet expansion.
+        """
         if self.subnet_links_df is None:
             msg = "Must set self.subnet_links_df before accessing subnet_nodes."
             raise ValueError(msg)
-        return node_ids_in_links(self.subnet_links_df, self.net.nodes_df)
+        _subnet_nodes_key = (self._subnet_version, self.net.modification_version)
+        if self._subnet_nodes is None or _subnet_nodes_key != self._subnet_nodes_key:
+            self._subnet_nodes = node_ids_in_links(self.subnet_links_df, self.net.nodes_df)
+            self._subnet_nodes_key = _subnet_nodes_key
+        return self._subnet_nodes
 
     @property
     def subnet_nodes_df(self) -> DataFrame[RoadNodesTable]:
@@ -187,48 +237,89 @@ class Subnet:
                 network expansion iterations of {max_search_breadth}"
             raise SubnetExpansionError(msg)
 
+    def _update_modal_links_index(self) -> None:
+        """Build the modal links and a node_id -> link positions lookup once per network version.
+
+        Lets each subnet expansion gather just the links touching the subnet rather than
+        rescanning every link in the network.
+        """
+        if self._modal_links_net_version == self.net.modification_version:
+            return
+        _modal_links_df = self.net.links_df.mode_query(self.modes)
+        _n = len(_modal_links_df)
+        # node ids and link positions are held for the life of the index and gathered on every
+        # expansion, so keep them in the smallest integer type that fits (usually int32).
+        _ab = pd.to_numeric(
+            np.concatenate([_modal_links_df.A.to_numpy(), _modal_links_df.B.to_numpy()]),
+            downcast="integer",
+        )
+        _link_positions = pd.to_numeric(np.tile(np.arange(_n), 2), downcast="integer")
+        self._node_to_modal_link_positions = {
+            node: _link_positions[positions]
+            for node, positions in pd.Series(_ab).groupby(_ab, sort=False).indices.items()
+        }
+        self._modal_links_df = _modal_links_df
+        self._modal_a = _ab[:_n]
+        self._modal_b = _ab[_n:]
+        self._modal_links_net_version = self.net.modification_version
+
     def _expand_subnet_breadth(self) -> None:
         """Add one degree of breadth to self.subnet_links_df and add property."""
         self._i += 1
 
         WranglerLogger.debug(f"Adding Breadth to Subnet: i={self._i}")
 
-        _modal_links_df = self.net.links_df.mode_query(self.modes)
-        # find links where A node is connected to subnet but not B node
-        _outbound_links_df = _modal_links_df.loc[
-            _modal_links_df.A.isin(self.subnet_nodes) & ~_modal_links_df.B.isin(self.subnet_nodes)
+        self._update_modal_links_index()
+        _subnet_nodes = self.subnet_nodes.to_numpy()
+        _positions = [
+            self._node_to_modal_link_positions[n]
+            for n in _subnet_nodes
+            if n in self._node_to_modal_link_positions
         ]
+        _positions = (
+            np.unique(np.concatenate(_positions)) if _positions else np.array([], dtype=int)
+        )
+        # only links touching the subnet can be added
+        _modal_links_df = self._modal_links_df.iloc[_positions]
+        _a_in_subnet = np.isin(self._modal_a[_positions], _subnet_nodes)
+        _b_in_subnet = np.isin(self._modal_b[_positions], _subnet_nodes)
 
-        WranglerLogger.debug(f"_outbound_links_df links: {len(_outbound_links_df)}")
+        # find links where A node is connected to subnet but not B node
+        _outbound = _a_in_subnet & ~_b_in_subnet
+        WranglerLogger.debug(f"_outbound_links_df links: {_outbound.sum()}")
 
         # find links where B node is connected to subnet but not A node
-        _inbound_links_df = _modal_links_df.loc[
-            _modal_links_df.B.isin(self.subnet_nodes) & ~_modal_links_df.A.isin(self.subnet_nodes)
-        ]
-
-        WranglerLogger.debug(f"_inbound_links_df links: {len(_inbound_links_df)}")
+        _inbound = _b_in_subnet & ~_a_in_subnet
+        WranglerLogger.debug(f"_inbound_links_df links: {_inbound.sum()}")
 
         # find links where A and B nodes are connected to subnet but not in subnet
-        _both_AB_connected_links_df = _modal_links_df.loc[
-            _modal_links_df.B.isin(self.subnet_nodes)
-            & _modal_links_df.A.isin(self.subnet_nodes)
-            & ~_modal_links_df.index.isin(self.subnet_links_df.index.tolist())
-        ]
-
+        _both_AB_connected = (
+            _a_in_subnet & _b_in_subnet & ~_modal_links_df.index.isin(self.subnet_links_df.index)
+        )
         WranglerLogger.debug(
-            f"{len(_both_AB_connected_links_df)} links where both A and B are connected to subnet\
+            f"{_both_AB_connected.sum()} links where both A and B are connected to subnet\
              but aren't in subnet."
         )
 
-        _add_links_df = concat_with_attr(
-            [_both_AB_connected_links_df, _inbound_links_df, _outbound_links_df]
-        )
+        # select all of the links to add at once rather than concatenating each group
+        _add_links_df = _modal_links_df.loc[_outbound | _inbound | _both_AB_connected].copy()
 
         _add_links_df["i"] = self._i
         WranglerLogger.debug(f"Links to add: {len(_add_links_df)}")
 
         WranglerLogger.debug(f"{self.num_links} initial subnet links")
 
+        _sp_graph_current = (
+            self._sp_graph is not None and self._sp_graph_key == self._graph_key_now
+        )
         self._subnet_links_df = concat_with_attr([self.subnet_links_df, _add_links_df])
+        self._subnet_version += 1
+
+        # grow the shortest path graph with just the added links rather than rebuilding it
+        if _sp_graph_current:
+            add_links_to_sp_graph(
+                self._sp_graph, _add_links_df, self._sp_weight_col, self._sp_weight_factor
+            )
+            self._sp_graph_key = self._graph_key_now
 
         WranglerLogger.debug(f"{self.num_links} expanded subnet links")
@@ -107,6 +107,7 @@ def set_df_index_to_pk(df: pd.DataFrame) -> pd.DataFrame:
         df (pd.DataFrame): data frame to set the index of
     """
     if df.index.name != df.attrs["idx_col"]:
-        df[df.attrs["idx_col"]] = df[df.attrs["primary_key"]]
-        df = df.set_index(df.attrs["idx_col"])
+        # index directly from the primary key values rather than adding and then dropping a
+        # temporary copy of the column, which also mutated the caller's dataframe
+        df = df.set_index(pd.Index(df[df.attrs["primary_key"]], name=df.attrs["idx_col"]))
     return df
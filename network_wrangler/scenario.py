@@ -158,6 +158,7 @@ import copy
 import pprint
 from collections import defaultdict, deque
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -509,11 +510,9 @@ class Scenario:
         """Check a list of projects' pre-requisites have been or will be applied to scenario."""
         if set(project_names).isdisjoint(set(self.prerequisites.keys())):
             return
-        _prereqs = []
-        for p in project_names:
-            _prereqs += self.prerequisites.get(p, [])
+        _prereqs = set(chain.from_iterable(self.prerequisites.get(p, []) for p in project_names))
         _projects_applied = self.applied_projects + project_names
-        _missing = list(set(_prereqs) - set(_projects_applied))
+        _missing = list(_prereqs - set(_projects_applied))
         if _missing:
             WranglerLogger.debug(
                 f"project_names: {project_names}\nprojects_have_or_will_be_applied: \
@@ -526,11 +525,9 @@ class Scenario:
         """Check a list of projects' co-requisites have been or will be applied to scenario."""
         if set(project_names).isdisjoint(set(self.corequisites.keys())):
             return
-        _coreqs = []
-        for p in project_names:
-            _coreqs += self.corequisites.get(p, [])
+        _coreqs = set(chain.from_iterable(self.corequisites.get(p, []) for p in project_names))
         _projects_applied = self.applied_projects + project_names
-        _missing = list(set(_coreqs) - set(_projects_applied))
+        _missing = list(_coreqs - set(_projects_applied))
         if _missing:
             WranglerLogger.debug(
                 f"project_names: {project_names}\nprojects_have_or_will_be_applied: \
@@ -547,10 +544,9 @@ class Scenario:
         if set(projects_to_check).isdisjoint(set(self.conflicts.keys())):
             # WranglerLogger.debug("Projects have no conflicts to check")
             return
-        _conflicts = []
-        for p in project_names:
-            _conflicts += self.conflicts.get(p, [])
-        _conflict_problems = [p for p in _conflicts if p in projects_to_check]
+        _conflicts = chain.from_iterable(self.conflicts.get(p, []) for p in project_names)
+        _projects_to_check = set(projects_to_check)
+        _conflict_problems = [p for p in _conflicts if p in _projects_to_check]
         if _conflict_problems:
             WranglerLogger.warning(f"Conflict Problems: \n{_conflict_problems}")
             _conf_dict = {
@@ -161,6 +161,7 @@ class Feed(DBModelMixin):
         table_df = self.get_table(table_name)
         updated_df = update_df_by_col_value(table_df, set_df, id_property, properties=properties)
         self.__dict__[table_name] = updated_df
+        self._mark_modified()
 
 
 PickupDropoffAvailability = Literal["either", "both", "pickup_only", "dropoff_only", "any"]
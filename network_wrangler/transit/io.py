@@ -7,6 +7,7 @@ from typing import Literal, Optional, Union
 import geopandas as gpd
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ..configs import DefaultConfig, WranglerConfig
 from ..errors import FeedReadError
@@ -36,6 +37,7 @@ def load_feed_from_path(
     file_format: TransitFileTypes = "txt",
     wrangler_flavored: bool = True,
     service_ids_filter: list[str] | None = None,
+    columns: dict[str, list[str]] | None = None,
     **read_kwargs,
 ) -> Feed | GtfsModel:
     """Create a Feed or GtfsModel object from the path to a GTFS transit feed.
@@ -46,6 +48,9 @@ def load_feed_from_path(
         wrangler_flavored: If True, creates a Wrangler-enhanced Feed object.
                           If False, creates a pure GtfsModel object. Defaults to True.
         service_ids_filter (Optional[list[str]]): If not None, filter to these service_ids. Assumes service_id is a str.
+        columns: If not None, mapping of table name to the columns to read from its file. Columns
+            required by the table's schema are always read. Tables that aren't in the mapping
+            are read with all of their columns. Defaults to None.
         **read_kwargs: Additional keyword arguments to pass to the file reader (e.g., low_memory, dtype)
 
     Returns:
@@ -93,8 +98,12 @@ def load_feed_from_path(
         )
 
     feed_files = {t: f[0] for t, f in feed_possible_files.items()}
+    read_columns = {
+        table: set(cols) | _required_columns(model_class, table)
+        for table, cols in (columns or {}).items()
+    }
     feed_dfs = {
-        table: _read_table_from_file(table, file, **read_kwargs)
+        table: _read_table_from_file(table, file, columns=read_columns.get(table), **read_kwargs)
         for table, file in feed_files.items()
     }
 
@@ -109,12 +118,24 @@ def load_feed_from_path(
     return feed_obj
 
 
-def _read_table_from_file(table: str, file: Path, **kwargs) -> pd.DataFrame:
+def _required_columns(model_class: type[GtfsModel], table: str) -> set[str]:
+    """Columns that the table's schema requires, which can't be left out when reading it."""
+    if table not in model_class._table_models:
+        return set()
+    schema = model_class._table_models[table].to_schema()
+    return {name for name, col in schema.columns.items() if col.required}
+
+
+def _read_table_from_file(
+    table: str, file: Path, columns: set[str] | None = None, **kwargs
+) -> pd.DataFrame:
     """Read a table from a file with support for additional kwargs.
 
     Args:
         table: Name of the table being read (for error messages)
         file: Path to the file to read
+        columns: If not None, only read these columns. Columns missing from the file are
+            ignored. Defaults to None.
         **kwargs: Additional keyword arguments to pass to the appropriate reader
 
     Returns:
@@ -123,8 +144,12 @@ def _read_table_from_file(table: str, file: Path, **kwargs) -> pd.DataFrame:
     WranglerLogger.debug(f"...reading {file}.")
     try:
         if file.suffix in [".csv", ".txt"]:
+            if columns is not None:
+                kwargs["usecols"] = lambda c: c in columns
             return pd.read_csv(file, **kwargs)
         if file.suffix == ".parquet":
+            if columns is not None:
+                kwargs["columns"] = [c for c in pq.read_schema(file).names if c in columns]
             return pd.read_parquet(file, **kwargs)
     except Exception as e:
         msg = f"Error reading table {table} from file: {file}.\n{e}"
@@ -176,6 +201,7 @@ def load_transit(
     feed: Feed | GtfsModel | dict[str, pd.DataFrame] | str | Path,
     file_format: TransitFileTypes = "txt",
     config: WranglerConfig = DefaultConfig,
+    columns: dict[str, list[str]] | None = None,
 ) -> TransitNetwork:
     """Create a [`TransitNetwork`][network_wrangler.transit.network.TransitNetwork] object.
 
@@ -189,6 +215,9 @@ def load_transit(
         feed: Feed boject, dict of transit data frames, or path to transit feed data
         file_format: the format of the files to read. Defaults to "txt"
         config: WranglerConfig object. Defaults to DefaultConfig.
+        columns: If reading from a path, optional mapping of table name to the columns to read
+            from its file. See [`load_feed_from_path`][network_wrangler.transit.io.load_feed_from_path].
+            Defaults to None.
 
     Returns:
         (TransitNetwork): object representing the loaded transit network.
@@ -211,7 +240,7 @@ def load_transit(
     """
     if isinstance(feed, Path | str):
         feed = Path(feed)
-        feed_obj = load_feed_from_path(feed, file_format=file_format)
+        feed_obj = load_feed_from_path(feed, file_format=file_format, columns=columns)
         feed_obj.feed_path = feed
     elif isinstance(feed, dict):
         feed_obj = load_feed_from_dfs(feed)
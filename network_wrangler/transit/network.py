@@ -56,6 +56,74 @@ if TYPE_CHECKING:
     from ..roadway.network import RoadwayNetwork
 
 
+def _apply_property_change_to_transit(
+    net: TransitNetwork,
+    change: ProjectCard | SubProject,
+    reference_road_net: RoadwayNetwork | None = None,  # noqa: ARG001
+) -> TransitNetwork:
+    return apply_transit_property_change(
+        net,
+        net.get_selection(change.transit_property_change["service"]),
+        change.transit_property_change["property_changes"],
+        project_name=change.project,
+    )
+
+
+def _apply_routing_change_to_transit(
+    net: TransitNetwork,
+    change: ProjectCard | SubProject,
+    reference_road_net: RoadwayNetwork | None = None,
+) -> TransitNetwork:
+    return apply_transit_routing_change(
+        net,
+        net.get_selection(change.transit_routing_change["service"]),
+        change.transit_routing_change["routing"],
+        reference_road_net=reference_road_net,
+        project_name=change.project,
+    )
+
+
+def _apply_pycode_to_transit(
+    net: TransitNetwork,
+    change: ProjectCard | SubProject,
+    reference_road_net: RoadwayNetwork | None = None,  # noqa: ARG001
+) -> TransitNetwork:
+    return apply_calculated_transit(net, change.pycode)
+
+
+def _apply_route_addition_to_transit(
+    net: TransitNetwork,
+    change: ProjectCard | SubProject,
+    reference_road_net: RoadwayNetwork | None = None,
+) -> TransitNetwork:
+    return apply_transit_route_addition(
+        net, change.transit_route_addition, reference_road_net=reference_road_net
+    )
+
+
+def _apply_service_deletion_to_transit(
+    net: TransitNetwork,
+    change: ProjectCard | SubProject,
+    reference_road_net: RoadwayNetwork | None = None,  # noqa: ARG001
+) -> TransitNetwork:
+    return apply_transit_service_deletion(
+        net,
+        net.get_selection(change.transit_service_deletion["service"]),
+        clean_shapes=change.transit_service_deletion.get("clean_shapes"),
+        clean_routes=change.transit_service_deletion.get("clean_routes"),
+    )
+
+
+# Maps a project card change type to the function that applies it to a TransitNetwork.
+TRANSIT_CHANGE_APPLIERS = {
+    "transit_property_change": _apply_property_change_to_transit,
+    "transit_routing_change": _apply_routing_change_to_transit,
+    "pycode": _apply_pycode_to_transit,
+    "transit_route_addition": _apply_route_addition_to_transit,
+    "transit_service_deletion": _apply_service_deletion_to_transit,
+}
+
+
 class TransitNetwork:
     """Representation of a Transit Network.
 
@@ -310,39 +378,9 @@ class TransitNetwork:
         if not isinstance(change, SubProject):
             WranglerLogger.info(f"Applying Project to Transit Network: {change.project}")
 
-        if change.change_type == "transit_property_change":
-            return apply_transit_property_change(
-                self,
-                self.get_selection(change.transit_property_change["service"]),
-                change.transit_property_change["property_changes"],
-                project_name=change.project,
-            )
-
-        if change.change_type == "transit_routing_change":
-            return apply_transit_routing_change(
-                self,
-                self.get_selection(change.transit_routing_change["service"]),
-                change.transit_routing_change["routing"],
-                reference_road_net=reference_road_net,
-                project_name=change.project,
-            )
-
-        if change.change_type == "pycode":
-            return apply_calculated_transit(self, change.pycode)
-
-        if change.change_type == "transit_route_addition":
-            return apply_transit_route_addition(
-                self,
-                change.transit_route_addition,
-                reference_road_net=reference_road_net,
-            )
-        if change.change_type == "transit_service_deletion":
-            return apply_transit_service_deletion(
-                self,
-                self.get_selection(change.transit_service_deletion["service"]),
-                clean_shapes=change.transit_service_deletion.get("clean_shapes"),
-                clean_routes=change.transit_service_deletion.get("clean_routes"),
-            )
-        msg = f"Not a currently valid transit project: {change}."
-        WranglerLogger.error(msg)
-        raise NotImplementedError(msg)
+        apply_func = TRANSIT_CHANGE_APPLIERS.get(change.change_type)
+        if apply_func is None:
+            msg = f"Not a currently valid transit project: {change}."
+            WranglerLogger.error(msg)
+            raise NotImplementedError(msg)
+        return apply_func(self, change, reference_road_net=reference_road_net)
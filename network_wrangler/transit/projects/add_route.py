@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Collection
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -84,11 +84,14 @@ def _add_route_to_feed(
     """
     WranglerLogger.debug(f"Adding route {len(add_routes)} to feed.")
 
-    shapes_df = copy.deepcopy(feed.shapes)
-    trips_df = copy.deepcopy(feed.trips)
-    stop_times_df = copy.deepcopy(feed.stop_times)
-    stops_df = copy.deepcopy(feed.stops)
-    frequencies_df = copy.deepcopy(feed.frequencies)
+    # collect the new rows and concatenate each table once rather than once per trip
+    shapes_dfs = [feed.shapes]
+    trips_dfs = [feed.trips]
+    stop_times_dfs = [feed.stop_times]
+    stops_dfs = [feed.stops]
+    frequencies_dfs = [feed.frequencies]
+    taken_shape_ids_s = feed.shapes["shape_id"]
+    existing_stop_ids = set(feed.stops["stop_id"])
 
     add_routes_df = pd.DataFrame(
         [{k: v for k, v in r.items() if k != "trips"} for r in add_routes]
@@ -97,40 +100,30 @@ def _add_route_to_feed(
     for route in add_routes:
         WranglerLogger.debug(f"Adding {len(route['trips'])} trips for route {route['route_id']}.")
 
-        shape_ids = create_str_int_combo_ids(len(route["trips"]), shapes_df["shape_id"])
+        shape_ids = create_str_int_combo_ids(len(route["trips"]), taken_shape_ids_s)
+        taken_shape_ids_s = pd.concat([taken_shape_ids_s, pd.Series(shape_ids)])
         for trip, shape_id in zip(route["trips"], shape_ids, strict=True):
-            add_shape_df = _create_new_shape(trip["routing"], shape_id, road_net)
-            shapes_df = concat_with_attr([shapes_df, add_shape_df], ignore_index=True, sort=False)
+            shapes_dfs.append(_create_new_shape(trip["routing"], shape_id, road_net))
 
             for j, headway in enumerate(trip["headway_secs"]):
                 trip_id = f"trip{j}_shp{shape_id}"
-                add_trips_df = _create_new_trips(trip, route, trip_id, shape_id)
-                add_freqs_df = _create_new_frequencies(headway, trip_id)
                 add_stop_times_df = _create_new_stop_times(trip["routing"], trip_id)
                 add_stops_df = _create_new_stops(
-                    add_stop_times_df["stop_id"], stops_df["stop_id"], road_net
+                    add_stop_times_df["stop_id"], existing_stop_ids, road_net
                 )
+                existing_stop_ids.update(add_stops_df["stop_id"])
 
-                # Add new data to existing dataframes
-                trips_df = concat_with_attr(
-                    [trips_df, add_trips_df], ignore_index=True, sort=False
-                )
-                frequencies_df = concat_with_attr(
-                    [frequencies_df, add_freqs_df], ignore_index=True, sort=False
-                )
-                stops_df = concat_with_attr(
-                    [stops_df, add_stops_df], ignore_index=True, sort=False
-                )
-                stop_times_df = concat_with_attr(
-                    [stop_times_df, add_stop_times_df], ignore_index=True, sort=False
-                )
+                trips_dfs.append(_create_new_trips(trip, route, trip_id, shape_id))
+                frequencies_dfs.append(_create_new_frequencies(headway, trip_id))
+                stops_dfs.append(add_stops_df)
+                stop_times_dfs.append(add_stop_times_df)
 
     feed.routes = routes_df
-    feed.shapes = shapes_df
-    feed.trips = trips_df
-    feed.stops = stops_df
-    feed.stop_times = stop_times_df
-    feed.frequencies = frequencies_df
+    feed.shapes = concat_with_attr(shapes_dfs, ignore_index=True, sort=False)
+    feed.trips = concat_with_attr(trips_dfs, ignore_index=True, sort=False)
+    feed.stops = concat_with_attr(stops_dfs, ignore_index=True, sort=False)
+    feed.stop_times = concat_with_attr(stop_times_dfs, ignore_index=True, sort=False)
+    feed.frequencies = concat_with_attr(frequencies_dfs, ignore_index=True, sort=False)
 
     return feed
 
@@ -260,13 +253,13 @@ def _create_new_stop_times(
 
 
 def _create_new_stops(
-    routing_node_ids: pd.Series, existing_stop_ids: pd.Series, road_net: RoadwayNetwork
+    routing_node_ids: pd.Series, existing_stop_ids: Collection, road_net: RoadwayNetwork
 ) -> paDataFrame[WranglerStopsTable]:
     """Create new stops entries for a trip if they don't already exist in the feed.
 
     Args:
         routing_node_ids: Series of node IDs from routing.
-        existing_stop_ids: Series of existing stop IDs.
+        existing_stop_ids: Existing stop IDs.
         road_net: Roadway network to get node coordinates.
     """
     add_stop_ids = routing_node_ids[~routing_node_ids.isin(existing_stop_ids)].unique()
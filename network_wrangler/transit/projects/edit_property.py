@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING
 
 from ...errors import ProjectCardError, TransitPropertyChangeError
 from ...logger import WranglerLogger
-from ...utils.data import validate_existing_value_in_df
+from ...utils.data import copy_to_edit, validate_existing_value_in_df
 
 if TYPE_CHECKING:
     from ...transit.network import TransitNetwork
@@ -82,7 +81,7 @@ def _apply_transit_property_change_to_table(
 
     # Update records matching trip_ids or matching frequencies
     if table_name in ["trips", "stop_times"]:
-        update_idx = table_df[table_df.trip_id.isin(selection.selected_trips)].index
+        update_idx = table_df.index[table_df.trip_id.isin(selection.selected_trips_df.trip_id)]
     elif table_name == "frequencies":
         update_idx = selection.selected_frequencies_df.index
     else:
@@ -94,7 +93,7 @@ def _apply_transit_property_change_to_table(
     ):
         return net
 
-    set_df = copy.deepcopy(table_df)
+    set_df = copy_to_edit(table_df)
 
     # Calculate build value
     if "set" in prop_change:
@@ -112,6 +111,7 @@ def _apply_transit_property_change_to_table(
 
     # Update in feed
     net.feed.__dict__[table_name] = set_df
+    net.feed._mark_modified()
 
     return net
 
@@ -27,7 +27,6 @@ from ..feed.shapes import (
     shape_ids_for_trip_ids,
     shapes_for_shape_id,
 )
-from ..feed.stop_times import stop_times_for_trip_id
 from ..feed.stops import node_is_stop
 from ..feed.trips import trip_ids_for_shape_id
 from ..validate import (
@@ -118,43 +117,6 @@ def _create_shapes(
     return new_shape_rows_df
 
 
-def _add_new_shape_copy(
-    old_shape_id: str,
-    trip_ids: list[str],
-    feed: Feed,
-    id_scalar: int = DefaultConfig.IDS.TRANSIT_SHAPE_ID_SCALAR,
-    project_name: str | None = None,
-) -> tuple[DataFrame[WranglerShapesTable], DataFrame[WranglerTripsTable], str]:
-    """Create an identical new shape_id from shape matching old_shape_id for the trip_ids.
-
-    Args:
-        old_shape_id (str): ID of shape to copy
-        trip_ids (list[str]): list of trip IDS to associate with new shape
-        feed: Input transit feed
-        id_scalar (int): scalar value to add to old_shape_id to create new_shape_id. Defaults to
-            SHAPE_ID_SCALAR.
-        project_name (str, optional): Name of the project. Defaults to None.
-
-    Returns:
-        tuple[pd.DataFrame]: updated (shapes_df, trips_df, new_shape_id)
-    """
-    WranglerLogger.debug(
-        f"Adding a new shape for shape_id: {old_shape_id} using scalar: {id_scalar}"
-    )
-    shapes = copy.deepcopy(feed.shapes)
-    trips = copy.deepcopy(feed.trips)
-    new_shape = copy.deepcopy(shapes[shapes.shape_id == old_shape_id])
-    new_shape_id = generate_new_id_from_existing(old_shape_id, shapes["shape_id"], id_scalar)
-    new_shape["shape_id"] = new_shape_id
-
-    if project_name is not None:
-        new_shape["projects"] = f"{project_name},"
-    shapes = concat_with_attr([shapes, new_shape], ignore_index=True)
-
-    trips.loc[trips.trip_id.isin(trip_ids), "shape_id"] = new_shape_id
-    return shapes, trips, new_shape_id
-
-
 def _replace_shapes_segment(
     routing_to_replace: list[int],
     shape_id: str,
@@ -206,11 +168,6 @@ def _replace_shapes_segment(
         set_routing, shape_id, road_net, project_name=project_name
     )
 
-    msg = f"\nShapes Segments: \nBefore: \n{before_segment[_disp_col]}\
-                         \nReplacement: \n{updated_segment_shapes_df[_disp_col]}\
-                         \nAfter: \n{after_segment[_disp_col]}"
-    # WranglerLogger.debug(msg)
-
     # Only concatenate those that aren't empty bc NaN values will transfer integers to floats.
     dfs = [before_segment, updated_segment_shapes_df, after_segment]
     concat_dfs = [df for df in dfs if not df.empty]
@@ -227,6 +184,7 @@ def _replace_shapes_segment(
 def _replace_stop_times_segment_for_trip(
     existing_stop_nodes: list[int],
     trip_id: str,
+    this_trip_stoptimes: DataFrame[WranglerStopTimesTable],
     set_stops_nodes: list[int],
     feed: Feed,
     project_name: str | None = None,
@@ -236,6 +194,7 @@ def _replace_stop_times_segment_for_trip(
     Args:
         existing_stop_nodes: list of roadway node ids for the existing segment to replace
         trip_id: selected trip_id to update
+        this_trip_stoptimes: existing stop_time records for trip_id, in stop_sequence order
         set_stops_nodes: list of roadway node ids to make stops
         feed: transit feed
         project_name: Name of the project. Defaults to None.
@@ -244,7 +203,6 @@ def _replace_stop_times_segment_for_trip(
         WranglerStopTimesTable: stop_time records for a trip_id with updated segment
     """
     # WranglerLogger.debug(f"Replacing existing nodes pattern: {existing_stop_nodes}")
-    this_trip_stoptimes = stop_times_for_trip_id(feed.stop_times, trip_id)
 
     _disp_col = ["stop_id", "stop_sequence"]
 
@@ -323,7 +281,7 @@ def _consistent_routing(
     return bool(same_route)
 
 
-def _update_shapes_and_trips(
+def _reroute_shape(
     feed: Feed,
     shape_id: str,
     trip_ids: list[str],
@@ -332,8 +290,11 @@ def _update_shapes_and_trips(
     road_net: RoadwayNetwork,
     routing_existing: list[int] | None = None,
     project_name: str | None = None,
-) -> tuple[DataFrame[WranglerShapesTable], DataFrame[WranglerTripsTable]]:
-    """Update shapes and trips for transit routing change.
+    new_shape_ids: list[str] | None = None,
+) -> tuple[DataFrame[WranglerShapesTable] | None, list[str]]:
+    """Create the rerouted shape records for a shape used by the selected trips.
+
+    Doesn't update the feed so that all rerouted shapes can be added to it at once.
 
     Args:
         feed: feed we are updating
@@ -344,9 +305,13 @@ def _update_shapes_and_trips(
         shape_id_scalar: scalar value to use when creating new shape_ids
         road_net: Reference roadway network to make sure shapes follow real links
         project_name: Name of the project. Defaults to None.
+        new_shape_ids: shape_ids already created for this change that aren't in the feed yet.
 
     Returns:
-        Updated shapes and trips dataframes
+        Tuple of the rerouted shape records, or None if the routing doesn't change, and the
+        selected trip_ids that should be moved to them. If no trips need to be moved, the
+        records replace shape_id; otherwise they are a copy with a new shape_id because other
+        trips still use shape_id.
     """
     WranglerLogger.debug(f"Updating shapes and trips for shape_id: {shape_id}")
     if routing_existing is None:
@@ -357,20 +322,7 @@ def _update_shapes_and_trips(
     # ----- Don't need a new shape if its only the stops that change -----
     if _consistent_routing(feed, shape_id, existing_routing, set_routing):
         WranglerLogger.debug("No routing change, returning shapes and trips as-is.")
-        return feed.shapes, feed.trips
-
-    # --- Create new shape if `shape_id` is used by trips that are not in selected trip_ids --
-    all_trips_using_shape_id = set(trip_ids_for_shape_id(feed.trips, shape_id))
-    sel_trips_using_shape_id = set(trip_ids) & all_trips_using_shape_id
-    if sel_trips_using_shape_id != all_trips_using_shape_id:
-        # adds copied shape with new shape_id to feed.shapes + references it in feed.trips
-        feed.shapes, feed.trips, shape_id = _add_new_shape_copy(
-            old_shape_id=shape_id,
-            trip_ids=list(sel_trips_using_shape_id),
-            feed=feed,
-            id_scalar=shape_id_scalar,
-            project_name=project_name,
-        )
+        return None, []
 
     # If "existing" is specified, replace only that segment else, replace the whole thing
     if existing_routing:
@@ -380,15 +332,25 @@ def _update_shapes_and_trips(
     else:
         this_shape = _create_shapes(set_routing, shape_id, road_net, project_name=project_name)
 
-    # Add rows back into shapes
-    unselected_shapes = feed.shapes[feed.shapes.shape_id != shape_id]
-    feed.shapes = concat_with_attr(
-        [unselected_shapes, this_shape],
-        ignore_index=True,
-        sort=False,
-    )
+    # --- Use a new shape if `shape_id` is used by trips that are not in selected trip_ids --
+    all_trips_using_shape_id = set(trip_ids_for_shape_id(feed.trips, shape_id))
+    sel_trips_using_shape_id = set(trip_ids) & all_trips_using_shape_id
+    if sel_trips_using_shape_id == all_trips_using_shape_id:
+        return this_shape, []
 
-    return feed.shapes, feed.trips
+    _existing_shape_ids = feed.shapes["shape_id"]
+    if new_shape_ids:
+        _existing_shape_ids = pd.concat([_existing_shape_ids, pd.Series(new_shape_ids)])
+    new_shape_id = generate_new_id_from_existing(shape_id, _existing_shape_ids, shape_id_scalar)
+    WranglerLogger.debug(
+        f"Adding a new shape {new_shape_id} for shape_id: {shape_id} using scalar: "
+        + f"{shape_id_scalar}"
+    )
+    this_shape["shape_id"] = new_shape_id
+    if project_name is not None:
+        # all records of a copied shape are attributed to the project
+        this_shape["projects"] = f"{project_name},"
+    return this_shape, list(sel_trips_using_shape_id)
 
 
 def _update_stops(
@@ -470,24 +432,28 @@ def _deletion_candidates(routing_set: list[int]) -> list[int]:
     return deletion_candidate_nodes
 
 
-def _update_stop_times_for_trip(
+def _rerouted_stop_times_for_trip(
     feed: Feed,
     trip_id: str,
+    this_trip_stop_times: DataFrame[WranglerStopTimesTable],
     routing_set: list[int],
     routing_existing: list[int],
     project_name: str | None = None,
 ) -> DataFrame[WranglerStopTimesTable]:
-    """Update stop_times for a specific trip with new stop_times.
+    """Create the updated stop_times records for a specific trip.
+
+    Doesn't update the feed so that the records of all rerouted trips can be replaced at once.
 
     Args:
         feed: Feed object
         trip_id: trip_id to update
+        this_trip_stop_times: existing stop_time records for trip_id, in stop_sequence order
         routing_set: List of model_node_ids to be stops
         routing_existing: List of model_node_ids to replace
         project_name: Name of the project. Defaults to None.
 
     Returns:
-        WranglerStopTimesTable: Updated stop_times.txt
+        WranglerStopTimesTable: Updated stop_times records for trip_id
     """
     WranglerLogger.debug(f"Updating stop times for trip: {trip_id}")
 
@@ -499,12 +465,11 @@ def _update_stop_times_for_trip(
     # WranglerLogger.debug(f"Delete stops: {del_stops_nodes}")
 
     # --------------- replace segment, delete stops, or replace whole thing ---------------
-    this_trip_stop_times = stop_times_for_trip_id(feed.stop_times, trip_id)
-
     if existing_stops_nodes and set_stops_nodes:
         this_trip_stop_times = _replace_stop_times_segment_for_trip(
             existing_stops_nodes,
             trip_id,
+            this_trip_stop_times,
             set_stops_nodes,
             feed,
             project_name=project_name,
@@ -521,24 +486,7 @@ def _update_stop_times_for_trip(
             set_stops_nodes, trip_id, project_name=project_name
         )
 
-    # --------------- Replace stop_times for this trip with updated stop times ---------------
-    stop_times_not_this_trip = feed.stop_times[feed.stop_times.trip_id != trip_id]
-    stop_times = concat_with_attr(
-        [stop_times_not_this_trip, this_trip_stop_times],
-        ignore_index=True,
-        sort=False,
-    )
-    _show_col = [
-        "trip_id",
-        "stop_id",
-        "stop_sequence",
-        "departure_time",
-        "arrival_time",
-    ]
-    msg = f"ST for trip: {stop_times.loc[stop_times.trip_id == trip_id, _show_col]}"
-    # WranglerLogger.debug(msg)
-
-    return stop_times
+    return this_trip_stop_times
 
 
 def apply_transit_routing_change(
@@ -591,8 +539,11 @@ def apply_transit_routing_change(
     # ---- update each shape that is used by selected trips to use new routing -------
     shape_ids = shape_ids_for_trip_ids(updated_feed.trips, trip_ids)
     # WranglerLogger.debug(f"shape_ids: {shape_ids}")
+    rerouted_shapes = []
+    replaced_shape_ids = []
+    trip_new_shape_ids: dict[str, str] = {}
     for shape_id in shape_ids:
-        updated_feed.shapes, updated_feed.trips = _update_shapes_and_trips(
+        this_shape, moved_trip_ids = _reroute_shape(
             updated_feed,
             shape_id,
             trip_ids,
@@ -601,7 +552,32 @@ def apply_transit_routing_change(
             road_net,
             routing_existing=routing_change.get("existing", []),
             project_name=project_name,
+            new_shape_ids=list(trip_new_shape_ids.values()),
         )
+        if this_shape is None:
+            continue
+        rerouted_shapes.append(this_shape)
+        if moved_trip_ids:
+            trip_new_shape_ids.update(dict.fromkeys(moved_trip_ids, this_shape["shape_id"].iat[0]))
+        else:
+            replaced_shape_ids.append(shape_id)
+
+    # Add the rerouted shapes in one go, replacing those that no other trips use
+    if rerouted_shapes:
+        kept_shapes = updated_feed.shapes.loc[
+            ~updated_feed.shapes.shape_id.isin(replaced_shape_ids)
+        ]
+        updated_feed.shapes = concat_with_attr(
+            [kept_shapes, *rerouted_shapes], ignore_index=True, sort=False
+        )
+    # Trips can only reference the copied shapes once they are in the feed
+    if trip_new_shape_ids:
+        trips = updated_feed.trips.copy()
+        moved_trips = trips.trip_id.isin(trip_new_shape_ids)
+        trips.loc[moved_trips, "shape_id"] = trips.loc[moved_trips, "trip_id"].map(
+            trip_new_shape_ids
+        )
+        updated_feed.trips = trips
     # WranglerLogger.debug(f"updated_feed.shapes: \n{updated_feed.shapes}")
     # WranglerLogger.debug(f"updated_feed.trips: \n{updated_feed.trips}")
     # ---- Check if any stops need adding to stops.txt and add if they do ----------
@@ -610,13 +586,26 @@ def apply_transit_routing_change(
     )
     # WranglerLogger.debug(f"updated_feed.stops: \n{updated_feed.stops}")
     # ---- Update stop_times --------------------------------------------------------
-    for trip_id in trip_ids:
-        updated_feed.stop_times = _update_stop_times_for_trip(
+    # Each trip only needs its own records, so find them all in one pass and replace them at once
+    stop_times = updated_feed.stop_times
+    trip_stop_time_rows = stop_times.groupby("trip_id", sort=False).indices
+    rerouted_stop_times = [
+        _rerouted_stop_times_for_trip(
             updated_feed,
             trip_id,
+            stop_times.iloc[trip_stop_time_rows.get(trip_id, [])].sort_values(
+                by=["stop_sequence"]
+            ),
             routing_change["set"],
             routing_change.get("existing", []),
         )
+        for trip_id in trip_ids
+    ]
+    updated_feed.stop_times = concat_with_attr(
+        [stop_times.loc[~stop_times.trip_id.isin(trip_ids)], *rerouted_stop_times],
+        ignore_index=True,
+        sort=False,
+    )
 
     # ---- Check result -------------------------------------------------------------
     _show_col = [
@@ -393,7 +393,7 @@ def _filter_trips_by_timespans(
     freq_df = freq_df.loc[freq_df.trip_id.isin(trips_df["trip_id"])]
 
     # Filter freq to time that overlaps selection
-    filtered_trip_ids = filter_df_to_overlapping_timespans(freq_df, timespans).trip_id.tolist()
+    filtered_trip_ids = filter_df_to_overlapping_timespans(freq_df, timespans).trip_id
 
     _filtered_trips = len(filtered_trip_ids)
     if _filtered_trips == 0:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -54,6 +56,85 @@ def dict_to_query(
     return query
 
 
+@lru_cache(maxsize=256)
+def _compile_any_pattern(patterns: tuple[str, ...]) -> re.Pattern | None:
+    """Compile a regex matching any of patterns, or None if they can't be combined.
+
+    One alternation scans each value once instead of once per pattern. Cached so that
+    selections repeated across project cards don't rebuild it. Patterns with capture groups
+    aren't combined because joining them renumbers the groups their backreferences point to.
+    """
+    try:
+        if any(re.compile(p).groups for p in patterns):
+            return None
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        return None
+
+
+def dict_to_mask(df: pd.DataFrame, selection_dict: Mapping[str, Any]) -> pd.Series:
+    """Generates a boolean mask of df from selection_dict using vectorized column operations.
+
+    Same logic as the query generated by `dict_to_query`: values within a list are OR'ed,
+    keys are AND'ed, strings are matched with `str.contains` and other values by equality.
+    Lists, tuples and sets of values are all treated as lists.
+    Avoids the row-by-row python engine that `str.contains` requires in `DataFrame.query`.
+    String columns are factorized once so `str.contains` only runs on their unique values,
+    which are few for columns like `name` or `roadway` compared to the number of links, and
+    a list of strings is matched as a single regex alternation.
+
+    Args:
+        df: dataframe to generate the mask for.
+        selection_dict: selection dictionary
+
+    Returns:
+        pd.Series: boolean mask aligned to df.index
+    """
+    _factorized: dict[str, tuple[np.ndarray, pd.Series]] = {}
+
+    def _str_contains(s: pd.Series, patterns: list[str]) -> pd.Series:
+        any_pattern = _compile_any_pattern(tuple(patterns))
+        if any_pattern is not None:
+            return s.str.contains(any_pattern, na=False)
+        # patterns that can't be combined, e.g. with inline flags or capture groups, are
+        # matched one at a time
+        _mask = pd.Series(False, index=s.index)
+        for p in patterns:
+            _mask |= s.str.contains(p, na=False)
+        return _mask
+
+    def _contains_mask(k, patterns: list[str]) -> pd.Series:
+        if k not in _factorized:
+            try:
+                codes, uniques = pd.factorize(df[k])
+            except TypeError:
+                # unhashable values such as lists can't be factorized
+                return _str_contains(df[k], patterns)
+            _factorized[k] = (codes, pd.Series(uniques))
+        codes, uniques = _factorized[k]
+        unique_matches = np.append(_str_contains(uniques, patterns).to_numpy(dtype=bool), False)
+        # missing values have code -1, which indexes the trailing False
+        return pd.Series(unique_matches[codes], index=df.index)
+
+    def _kv_to_mask(k, v) -> pd.Series:
+        if isinstance(v, list | tuple | set | frozenset):
+            str_v = [i for i in v if isinstance(i, str)]
+            _mask = _contains_mask(k, str_v) if str_v else pd.Series(False, index=df.index)
+            # one hashed lookup for the rest; missing values never match, as with ==
+            other_v = [i for i in v if not isinstance(i, str) and pd.notna(i)]
+            if other_v:
+                _mask |= df[k].isin(other_v)
+            return _mask
+        if isinstance(v, str):
+            return _contains_mask(k, [v])
+        return df[k] == v
+
+    mask = pd.Series(True, index=df.index)
+    for k, v in selection_dict.items():
+        mask &= _kv_to_mask(k, v)
+    return mask
+
+
 def _df_missing_cols(df, cols):
     return [col for col in cols if col not in df.columns]
 
@@ -558,12 +639,14 @@ def validate_existing_value_in_df(df: pd.DataFrame, idx: list[int], field: str,
     if field not in df.columns:
         WranglerLogger.warning(f"!! {field} Not an existing field.")
         return False
-    if not df.loc[idx, field].eq(expected_value).all():
+    existing = df.loc[idx, field]
+    matches = existing.eq(expected_value).to_numpy(dtype=bool, na_value=True)
+    if not matches.all():
         WranglerLogger.warning(
             f"Existing value defined for {field} in project card \
             does not match the value in the selection links. \n\
             Specified Existing: {expected_value}\n\
-            Actual Existing: \n {df.loc[idx, field]}."
+            Actual Existing: \n {existing[~matches]}."
         )
         return False
     return True
@@ -589,15 +672,16 @@ def coerce_val_to_df_types(  # noqa: PLR0911
     if field not in df.columns:
         msg = f"Field {field} not in dataframe columns."
         raise ValueError(msg)
-    if pd.api.types.infer_dtype(df[field]) == "integer":
+    _field_type = pd.api.types.infer_dtype(df[field])
+    if _field_type == "integer":
         if isinstance(val, list):
             return [int(float(v)) for v in val]
         return int(float(val))
-    if pd.api.types.infer_dtype(df[field]) == "floating":
+    if _field_type == "floating":
         if isinstance(val, list):
             return [float(v) for v in val]
         return float(val)
-    if pd.api.types.infer_dtype(df[field]) == "boolean":
+    if _field_type == "boolean":
         if isinstance(val, list):
             return [bool(v) for v in val]
         return bool(val)
@@ -637,14 +721,15 @@ def coerce_dict_to_df_types(
         if k not in df.columns:
             msg = f"Key {k} not in dataframe columns."
             raise ValueError(msg)
-        if pd.api.types.infer_dtype(df[k]) == "integer":
+        _field_type = pd.api.types.infer_dtype(df[k])
+        if _field_type == "integer":
             if isinstance(vals, list):
                 coerced_v: CoerceTypes = [int(float(v)) for v in vals]
             else:
                 coerced_v = int(float(vals))
-        elif pd.api.types.infer_dtype(df[k]) == "floating":
+        elif _field_type == "floating":
             coerced_v = [float(v) for v in vals] if isinstance(vals, list) else float(vals)
-        elif pd.api.types.infer_dtype(df[k]) == "boolean":
+        elif _field_type == "boolean":
             coerced_v = [bool(v) for v in vals] if isinstance(vals, list) else bool(vals)
         elif isinstance(vals, list):
             coerced_v = [str(v) for v in vals]
@@ -666,12 +751,13 @@ def coerce_val_to_series_type(val, s: pd.Series) -> float | str | bool:
     """
     # WranglerLogger.debug(f"Input val: {val} of type {type(val)} to match with series type \
     #    {pd.api.types.infer_dtype(s)}.")
-    if pd.api.types.infer_dtype(s) in ["integer", "floating"]:
+    _s_type = pd.api.types.infer_dtype(s)
+    if _s_type in ["integer", "floating"]:
         try:
             v: float | str | bool = float(val)
         except:
             v = str(val)
-    elif pd.api.types.infer_dtype(s) == "boolean":
+    elif _s_type == "boolean":
         v = bool(val)
     else:
         v = str(val)
@@ -689,7 +775,15 @@ def fk_in_pk(
     if ignore_nan:
         fk = fk.dropna()
 
-    missing_flag = ~fk.isin(pk)
+    if isinstance(fk.dtype, pd.StringDtype) or isinstance(
+        getattr(pk, "dtype", None), pd.StringDtype
+    ):
+        # isin is slow for string dtypes; compare integer codes from factorizing both together
+        pk = pd.Series(pk)
+        codes, _ = pd.factorize(pd.concat([pk, fk], ignore_index=True))
+        missing_flag = pd.Series(~np.isin(codes[len(pk) :], codes[: len(pk)]), index=fk.index)
+    else:
+        missing_flag = ~fk.isin(pk)
 
     if missing_flag.any():
         WranglerLogger.warning(
@@ -710,6 +804,26 @@ def dict_fields_in_df(d: dict, df: pd.DataFrame) -> bool:
     return True
 
 
+# first pandas major version where copy-on-write is always enabled
+PANDAS_COW_MAJOR_VERSION = 3
+
+
+def copy_on_write() -> bool:
+    """True if pandas copy-on-write is in effect, so shallow copies of tables can't leak edits."""
+    if int(pd.__version__.split(".")[0]) >= PANDAS_COW_MAJOR_VERSION:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def copy_to_edit(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of df that can be edited without changing df.
+
+    With copy-on-write, a shallow copy is enough and only the columns that get edited are
+    copied, instead of every column up front.
+    """
+    return df.copy(deep=not copy_on_write())
+
+
 def concat_with_attr(dfs: list[pd.DataFrame], **kwargs) -> pd.DataFrame:
     """Concatenate a list of dataframes and retain the attributes of the first dataframe."""
     import copy
@@ -728,6 +842,29 @@ def concat_with_attr(dfs: list[pd.DataFrame], **kwargs) -> pd.DataFrame:
     return df
 
 
+def index_isin(index: pd.Index, values) -> np.ndarray:
+    """Boolean mask of which index labels are in values, like `index.isin(values)`.
+
+    When the index is unique, looks the values up with the index's cached hash engine instead
+    of hashing every label, so selecting a handful of ids from a large table is O(len(values)).
+
+    Args:
+        index: index to check, such as the model_link_id_idx of a links table.
+        values: values to look for in the index.
+
+    Returns:
+        np.ndarray: boolean mask aligned to index
+    """
+    if not index.is_unique:
+        return index.isin(values)
+    if isinstance(values, (set, frozenset)):
+        values = list(values)
+    positions = index.get_indexer(pd.Index(values).unique())
+    mask = np.zeros(len(index), dtype=bool)
+    mask[positions[positions >= 0]] = True
+    return mask
+
+
 def isin_dict(
     df: pd.DataFrame, d: dict, ignore_missing: bool = True, strict_str: bool = False
 ) -> pd.DataFrame:
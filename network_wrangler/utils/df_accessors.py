@@ -6,7 +6,7 @@ import pandas as pd
 
 from ..errors import SelectionError
 from ..logger import WranglerLogger
-from .data import dict_to_query, isin_dict
+from .data import dict_to_mask, isin_dict
 
 
 @pd.api.extensions.register_dataframe_accessor("dict_query")
@@ -57,9 +57,7 @@ class DictQueryAccessor:
             msg = f"Relevant part of selection dictionary is empty: {selection_dict}"
             raise SelectionError(msg)
 
-        _sel_query = dict_to_query(_selection_dict)
-        # WranglerLogger.debug(f"_sel_query: \n   {_sel_query}")
-        _df = self._obj.query(_sel_query, engine="python")
+        _df = self._obj.loc[dict_to_mask(self._obj, _selection_dict)]
 
         if len(_df) == 0:
             WranglerLogger.warning(
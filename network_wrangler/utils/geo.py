@@ -8,7 +8,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from geographiclib.geodesic import Geodesic
 from pyproj import CRS, Proj, Transformer
 from shapely.geometry import LineString, Point
@@ -94,8 +96,7 @@ def length_of_linestring_miles(gdf: gpd.GeoSeries | gpd.GeoDataFrame) -> pd.Seri
     if isinstance(gdf, gpd.GeoSeries):
         gdf = gpd.GeoDataFrame(geometry=gdf)
 
-    p_crs = gdf.estimate_utm_crs()
-    gdf = gdf.to_crs(p_crs)
+    gdf = gdf.to_crs(_id_utm_crs(gdf))
     METERS_IN_MILES = 1609.34
     length_miles = gdf.geometry.length / METERS_IN_MILES
     length_s = pd.Series(length_miles, index=gdf.index)
@@ -175,10 +176,17 @@ def linestring_from_nodes(
         msg = "Cannot create link geometry from nodes because the nodes are missing from the network."
         raise MissingNodesError(msg)
 
-    # create geometry from points
-    links_geo_df["geometry"] = links_geo_df.apply(
-        lambda row: LineString([row["geometry_A"], row["geometry_B"]]), axis=1
+    # create geometry from points in a single vectorized call rather than row-by-row
+    geom_a = links_geo_df["geometry_A"].to_numpy()
+    geom_b = links_geo_df["geometry_B"].to_numpy()
+    coords = np.stack(
+        [
+            np.column_stack([shapely.get_x(geom_a), shapely.get_y(geom_a)]),
+            np.column_stack([shapely.get_x(geom_b), shapely.get_y(geom_b)]),
+        ],
+        axis=1,
     )
+    links_geo_df["geometry"] = shapely.linestrings(coords)
 
     # convert to GeoDataFrame
     links_gdf = gpd.GeoDataFrame(links_geo_df["geometry"], geometry=links_geo_df["geometry"])
@@ -197,16 +205,13 @@ def linestring_from_lats_lons(df, lat_fields, lon_fields) -> gpd.GeoSeries:
         msg = "lon_fields and lat_fields lists must have the same length"
         raise ValueError(msg)
 
-    line_geometries = gpd.GeoSeries(
-        [
-            LineString(
-                [(row[lon], row[lat]) for lon, lat in zip(lon_fields, lat_fields, strict=True)]
-            )
-            for _, row in df.iterrows()
-        ]
+    # build an (n_links, n_points, 2) coordinate array from the lon/lat columns and create all
+    # linestrings in one call rather than row-by-row
+    coords = np.stack(
+        [df[list(lon_fields)].to_numpy(dtype=float), df[list(lat_fields)].to_numpy(dtype=float)],
+        axis=-1,
     )
-
-    return gpd.GeoSeries(line_geometries)
+    return gpd.GeoSeries(shapely.linestrings(coords))
 
 
 def check_point_valid_for_crs(point: Point, crs: int):
@@ -262,6 +267,53 @@ def point_from_xy(x, y, xy_crs: int = LAT_LON_CRS, point_crs: int = LAT_LON_CRS)
     return transform(transformers[(xy_crs, point_crs)].transform, point)
 
 
+def point_series_from_xy(
+    x: pd.Series,
+    y: pd.Series,
+    xy_crs: int = LAT_LON_CRS,
+    point_crs: int = LAT_LON_CRS,
+) -> gpd.GeoSeries:
+    """Creates a GeoSeries of points from x and y coordinate series in one vectorized pass.
+
+    Array-based equivalent of calling `point_from_xy` on each x/y pair.
+
+    Args:
+        x: x coordinates, in xy_crs
+        y: y coordinates, in xy_crs
+        xy_crs: coordinate reference system in ESPG code for x/y inputs. Defaults to 4326 (WGS84)
+        point_crs: coordinate reference system in ESPG code for point output.
+            Defaults to 4326 (WGS84)
+
+    Returns: GeoSeries of Shapely Points in point_crs with the same index as x.
+    """
+    x_arr = np.asarray(x, dtype=np.float64)
+    y_arr = np.asarray(y, dtype=np.float64)
+
+    if xy_crs == point_crs:
+        crs = CRS.from_user_input(point_crs)
+        minx, miny, maxx, maxy = crs.area_of_use.bounds
+        bad_x = ~((minx <= x_arr) & (x_arr <= maxx))
+        bad_y = ~((miny <= y_arr) & (y_arr <= maxy))
+        if bad_x.any() or bad_y.any():
+            bad = bad_x | bad_y
+            WranglerLogger.error(
+                f"Invalid coordinates for CRS {crs}: {np.column_stack([x_arr, y_arr])[bad]}"
+            )
+            msg = f"Invalid coordinate for CRS {crs}: {x_arr[bad][0]}, {y_arr[bad][0]}"
+            raise InvalidCRSError(msg)
+    else:
+        if (xy_crs, point_crs) not in transformers:
+            transformers[(xy_crs, point_crs)] = Transformer.from_proj(
+                Proj(f"EPSG:{xy_crs}"),
+                Proj(f"EPSG:{point_crs}"),
+                always_xy=True,
+            )
+        x_arr, y_arr = transformers[(xy_crs, point_crs)].transform(x_arr, y_arr)
+
+    index = x.index if isinstance(x, pd.Series) else None
+    return gpd.GeoSeries(gpd.points_from_xy(x_arr, y_arr), index=index, crs=point_crs)
+
+
 def update_points_in_linestring(
     linestring: LineString, updated_coords: list[float], position: int
 ):
@@ -299,12 +351,17 @@ def update_nodes_in_linestring_geometry(
         suffixes=("", "_node"),
     )
 
-    updated_df["geometry"] = updated_df.apply(
-        lambda row: update_points_in_linestring(
-            row["geometry"], row["geometry_node"].coords[0], position
-        ),
-        axis=1,
+    # replace the coordinate at `position` in every linestring at once using the flat coordinate
+    # array rather than rebuilding each linestring row-by-row
+    geoms = updated_df["geometry"].to_numpy()
+    coords, geom_idx = shapely.get_coordinates(geoms, return_index=True)
+    n_coords = shapely.get_num_coordinates(geoms)
+    first_coord_idx = np.cumsum(n_coords) - n_coords
+    coord_pos = position if position >= 0 else n_coords + position
+    coords[first_coord_idx + coord_pos] = shapely.get_coordinates(
+        updated_df["geometry_node"].to_numpy()
     )
+    updated_df["geometry"] = shapely.linestrings(coords, indices=geom_idx)
 
     # Drop the merge columns and restore original index
     updated_df = updated_df.drop(columns=["model_node_id", "geometry_node"])
@@ -465,9 +522,36 @@ def _id_utm_crs(gdf: gpd.GeoSeries | gpd.GeoDataFrame) -> int:
     if isinstance(gdf, gpd.GeoSeries):
         gdf = gpd.GeoDataFrame(geometry=gdf)
 
+    if gdf.crs is not None and gdf.crs.equals(LAT_LON_CRS):
+        utm_epsg = _utm_epsg_from_lat_lon_bounds(*gdf.total_bounds)
+        if utm_epsg is not None:
+            return utm_epsg
     return gdf.estimate_utm_crs().to_epsg()
 
 
+def _utm_epsg_from_lat_lon_bounds(
+    west: float, south: float, east: float, north: float
+) -> int | None:
+    """Returns the WGS 84 UTM EPSG for lat/lon bounds falling strictly within one UTM zone.
+
+    Matches `estimate_utm_crs` for those bounds without its pyproj database query, which
+    dominates the cost of projecting small selections. Returns None when the bounds touch or
+    cross a zone or hemisphere edge so the caller can fall back to `estimate_utm_crs`.
+    """
+    if not np.isfinite([west, south, east, north]).all():
+        return None
+    if (west + 180) % 6 == 0 or (east + 180) % 6 == 0:
+        return None
+    zone = int((west + 180) // 6) + 1
+    if zone != int((east + 180) // 6) + 1 or not 1 <= zone <= 60:  # noqa: PLR2004
+        return None
+    if south > 0 and north < 84:  # noqa: PLR2004
+        return 32600 + zone
+    if south > -80 and north < 0:  # noqa: PLR2004
+        return 32700 + zone
+    return None
+
+
 def offset_geometry_meters(geo_s: gpd.GeoSeries, offset_distance_meters: float) -> gpd.GeoSeries:
     """Offset a GeoSeries of LineStrings by a given distance in meters.
 
@@ -480,8 +564,11 @@ def offset_geometry_meters(geo_s: gpd.GeoSeries, offset_distance_meters: float)
     og_crs = geo_s.crs
     meters_crs = _id_utm_crs(geo_s)
     geo_s = geo_s.to_crs(meters_crs)
-    offset_geo = geo_s.apply(lambda x: x.offset_curve(offset_distance_meters))
-    offset_geo = gpd.GeoSeries(offset_geo)
+    offset_geo = gpd.GeoSeries(
+        shapely.offset_curve(geo_s.values, offset_distance_meters),
+        index=geo_s.index,
+        crs=meters_crs,
+    )
     return offset_geo.to_crs(og_crs)
 
 
@@ -1,6 +1,7 @@
 """Utilities for generating ID values."""
 
 import re
+from collections.abc import Container
 
 import pandas as pd
 
@@ -32,11 +33,21 @@ def generate_new_id_from_existing(
         iter_val: iteration value to use in the generation process.
         max_iter: maximum number of iterations allowed in the generation process.
     """
+    return _generate_new_id_not_in(input_id, set(existing_ids), id_scalar, iter_val, max_iter)
+
+
+def _generate_new_id_not_in(
+    input_id: str,
+    existing_ids: Container[str],
+    id_scalar: int,
+    iter_val: int,
+    max_iter: int,
+) -> str:
     str_prefix, input_id, str_suffix = split_string_prefix_suffix_from_num(input_id)
 
     for i in range(1, max_iter + 1):
         new_id = f"{str_prefix}{int(input_id) + id_scalar + (iter_val * i)}{str_suffix}"
-        if new_id not in existing_ids.values:
+        if new_id not in existing_ids:
             return new_id
     msg = f"Cannot generate new id within max iters of {max_iter}."
     WranglerLogger.error(msg)
@@ -70,13 +81,7 @@ def generate_list_of_new_ids_from_existing(
     new_ids = []
     existing_ids = set(existing_ids)
     for i in input_ids:
-        new_id = generate_new_id_from_existing(
-            i,
-            pd.Series(list(existing_ids)),
-            id_scalar,
-            iter_val=iter_val,
-            max_iter=max_iter,
-        )
+        new_id = _generate_new_id_not_in(i, existing_ids, id_scalar, iter_val, max_iter)
         new_ids.append(new_id)
         existing_ids.add(new_id)
     return new_ids
@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import psutil
 
@@ -41,6 +42,41 @@ class FileWriteError(Exception):
     """Raised when there is an error writing a file."""
 
 
+def _gdf_to_geojson_bytes(gdf: gpd.GeoDataFrame) -> bytes:
+    """Encode a GeoDataFrame as GeoJSON, using orjson when it is installed (`speedups` extra).
+
+    GeoDataFrame.to_json encodes with the standard library json module, which is slow for large
+    networks.
+    """
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        return gdf.to_json(drop_id=True).encode("utf-8")
+    return orjson.dumps(gdf.to_geo_dict(drop_id=True), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _datetimes_to_time_str(df: pd.DataFrame) -> pd.DataFrame:
+    """Format naive datetime columns as HH:MM:SS strings ahead of writing to csv.
+
+    to_csv's date_format calls strftime one value at a time, which dominates writing large
+    stop_times tables. Missing values stay missing so they are still written as empty cells.
+    """
+    time_cols = {}
+    for col in df.columns:
+        s = df[col]
+        if not pd.api.types.is_datetime64_dtype(s) or isinstance(s.dtype, pd.DatetimeTZDtype):
+            continue
+        secs = (s - s.dt.normalize()).dt.total_seconds().to_numpy()
+        has_time = ~np.isnan(secs)
+        hours, rem = np.divmod(secs[has_time].astype(np.int64), 3600)
+        minutes, seconds = np.divmod(rem, 60)
+        time_str = np.full(len(s), np.nan, dtype=object)
+        hms = zip(hours.tolist(), minutes.tolist(), seconds.tolist(), strict=True)
+        time_str[has_time] = [f"{h:02d}:{m:02d}:{sec:02d}" for h, m, sec in hms]
+        time_cols[col] = pd.Series(time_str, index=s.index)
+    return df.assign(**time_cols) if time_cols else df
+
+
 def write_table(
     df: pd.DataFrame | gpd.GeoDataFrame,
     filename: Path,
@@ -67,21 +103,29 @@ def write_table(
     WranglerLogger.debug(f"Writing to {filename}.")
 
     if "shp" in filename.suffix:
+        # pyogrio with arrow hands GDAL whole columns rather than building a record per row
+        kwargs = {"engine": "pyogrio", "use_arrow": True, **kwargs}
         df.to_file(filename, index=False, **kwargs)
     elif "parquet" in filename.suffix:
+        # attrs such as source_file paths aren't json serializable parquet metadata
+        df = df.copy(deep=False)
+        df.attrs = {}
+        if isinstance(df, gpd.GeoDataFrame) and _has_single_geometry_types(df):
+            # geoarrow stores coordinates as native arrays, which read much faster than WKB
+            kwargs = {"geometry_encoding": "geoarrow", "write_covering_bbox": True, **kwargs}
         df.to_parquet(filename, index=False, **kwargs)
     elif "csv" in filename.suffix or "txt" in filename.suffix:
+        df = _datetimes_to_time_str(df)
         df.to_csv(filename, index=False, date_format="%H:%M:%S", **kwargs)
     elif "geojson" in filename.suffix:
         # required due to issues with list-like columns
         if isinstance(df, gpd.GeoDataFrame):
             # Reset index to avoid pandas 3.0/pyarrow compatibility issues with to_json
             # Since drop_id=True, we don't need the original index anyway
-            data = df.reset_index(drop=True).to_json(drop_id=True)
+            filename.write_bytes(_gdf_to_geojson_bytes(df.reset_index(drop=True)))
         else:
-            data = df.to_json(orient="records", index=False)
-        with filename.open("w", encoding="utf-8") as file:
-            file.write(data)
+            with filename.open("w", encoding="utf-8") as file:
+                file.write(df.to_json(orient="records", index=False))
     elif "json" in filename.suffix:
         with filename.open("w") as f:
             f.write(df.to_json(orient="records"))
@@ -90,6 +134,16 @@ def write_table(
         raise NotImplementedError(msg)
 
 
+def _has_single_geometry_types(gdf: gpd.GeoDataFrame) -> bool:
+    """True if each geometry column holds one geometry type, as geoarrow encoding requires.
+
+    Mixed types either can't be encoded or, like LineString and MultiLineString, are all
+    promoted to the multi type.
+    """
+    geo_cols = gdf.select_dtypes(include=["geometry"]).columns
+    return all(gdf[c].geom_type.nunique(dropna=True) <= 1 for c in geo_cols)
+
+
 def _estimate_read_time_of_file(
     filepath: str | Path, read_speed: dict = DefaultConfig.CPU.EST_PD_READ_SPEED
 ) -> str:
@@ -115,6 +169,7 @@ def read_table(
     boundary_geocode: str | None = None,
     boundary_file: Path | None = None,
     read_speed: dict = DefaultConfig.CPU.EST_PD_READ_SPEED,
+    filters: list[tuple] | None = None,
 ) -> pd.DataFrame | gpd.GeoDataFrame:
     """Read file and return a dataframe or geodataframe.
 
@@ -142,6 +197,9 @@ def read_table(
             geographic data. Defaults to None.
         read_speed: dictionary of read speeds for different file types. Defaults to
             DefaultConfig.CPU.EST_PD_READ_SPEED.
+        filters: row filters such as `[("A", "in", node_ids)]` that parquet files apply while
+            reading so rows that don't match are never loaded. Ignored for other file types.
+            Defaults to None.
     """
     filename = Path(filename)
     if not filename.exists():
@@ -168,16 +226,15 @@ def read_table(
 
     if any(x in filename.suffix for x in ["geojson", "shp", "csv"]):
         try:
-            # masking only supported by fiona engine, which is slower.
-            if mask_gdf is None:
-                return gpd.read_file(filename, engine="pyogrio")
-            return gpd.read_file(filename, mask=mask_gdf, engine="fiona")
+            # pyogrio reads in bulk and applies the mask as a GDAL spatial filter; with arrow it
+            # hands back whole columns rather than building a record per feature
+            return gpd.read_file(filename, mask=mask_gdf, engine="pyogrio", use_arrow=True)
         except Exception as err:
             if "csv" in filename.suffix:
                 return pd.read_csv(filename)
             raise FileReadError from err
     elif "parquet" in filename.suffix:
-        return _read_parquet_table(filename, mask_gdf)
+        return _read_parquet_table(filename, mask_gdf, filters)
     elif "json" in filename.suffix:
         with filename.open() as f:
             return pd.read_json(f, orient="records")
@@ -185,8 +242,8 @@ def read_table(
     raise NotImplementedError(msg)
 
 
-def _read_parquet_table(filename, mask_gdf) -> gpd.GeoDataFrame | pd.DataFrame:
-    """Read a parquet file and filter to a bounding box if provided.
+def _read_parquet_table(filename, mask_gdf, filters=None) -> gpd.GeoDataFrame | pd.DataFrame:
+    """Read a parquet file and filter to a bounding box and row filters if provided.
 
     Converts numpy arrays to lists.
 
@@ -197,19 +254,19 @@ def _read_parquet_table(filename, mask_gdf) -> gpd.GeoDataFrame | pd.DataFrame:
     """
     try:
         if mask_gdf is None:
-            df = gpd.read_parquet(filename)
+            df = gpd.read_parquet(filename, filters=filters)
         else:
             try:
-                df = gpd.read_parquet(filename, bbox=mask_gdf.total_bounds)
+                df = gpd.read_parquet(filename, bbox=mask_gdf.total_bounds, filters=filters)
             except TypeError:
                 WranglerLogger.warning(
                     f"Could not filter to bounding box {mask_gdf}.\
                                         Try upgrading to geopandas > 1.0.\
                                         Returning unfiltered data."
                 )
-                df = gpd.read_parquet(filename)
+                df = gpd.read_parquet(filename, filters=filters)
     except:
-        df = pd.read_parquet(filename)
+        df = pd.read_parquet(filename, filters=filters)
 
     _cols = [col for col in df.columns if col.startswith("sc_")]
     for col in _cols:
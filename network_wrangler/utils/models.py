@@ -1,7 +1,7 @@
 """Helper functions for data models."""
 
 import copy
-from functools import wraps
+from functools import cache, wraps
 from pathlib import Path
 from types import UnionType
 from typing import Union, _GenericAlias, get_args, get_origin, get_type_hints
@@ -32,13 +32,16 @@ def _convert_string_dtype_to_object(df: DataFrame) -> DataFrame:
     """
     import pyarrow as pa
 
+    string_cols = [
+        col
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.StringDtype)
+        or (isinstance(dtype, pd.ArrowDtype) and pa.types.is_string(dtype.pyarrow_dtype))
+    ]
+    if not string_cols:
+        return df
     df = df.copy()
-    for col in df.columns:
-        dtype = df[col].dtype
-        if isinstance(dtype, pd.StringDtype) or (
-            isinstance(dtype, pd.ArrowDtype) and pa.types.is_string(dtype.pyarrow_dtype)
-        ):
-            df[col] = df[col].astype(object)
+    df[string_cols] = df[string_cols].astype(object)
     return df
 
 
@@ -77,14 +80,16 @@ def default_from_datamodel(data_model: pa.DataFrameModel, field: str):
     return None
 
 
-def fill_df_with_defaults_from_model(df, model):
+def fill_df_with_defaults_from_model(df, model, columns: list[str] | None = None):
     """Fill a DataFrame with default values from a Pandera DataFrameModel.
 
     Args:
         df: DataFrame to fill with default values.
         model: Pandera DataFrameModel to get default values from.
+        columns: If not None, only fill these columns. Defaults to None.
     """
-    for c in df.columns:
+    fill_cols = df.columns if columns is None else [c for c in columns if c in df.columns]
+    for c in fill_cols:
         default_value = default_from_datamodel(model, c)
         if default_value is None:
             df[c] = df[c].where(pd.notna(df[c]), None)
@@ -93,9 +98,19 @@ def fill_df_with_defaults_from_model(df, model):
     return df
 
 
+@cache
+def _column_subset_schema(model: type[DataFrameModel], columns: tuple[str, ...]):
+    """Schema of model restricted to the named columns it defines."""
+    schema = model.to_schema()
+    return schema.select_columns([c for c in columns if c in schema.columns])
+
+
 @validate_call(config={"arbitrary_types_allowed": True})
 def validate_df_to_model(
-    df: DataFrame, model: type, output_file: Path = Path("validation_failure_cases.csv")
+    df: DataFrame,
+    model: type,
+    output_file: Path = Path("validation_failure_cases.csv"),
+    columns: list[str] | None = None,
 ) -> DataFrame:
     """Wrapper to validate a DataFrame against a Pandera DataFrameModel with better logging.
 
@@ -106,14 +121,17 @@ def validate_df_to_model(
         model: Pandera DataFrameModel to validate against.
         output_file: Optional file to write validation errors to. Defaults to
             validation_failure_cases.csv.
+        columns: If not None, only validate and coerce these columns, e.g. the ones edited in a
+            table that already validated to the model. Defaults to None.
     """
     attrs = copy.deepcopy(df.attrs)
     err_msg = f"Validation to {model.__name__} failed."
+    schema = model if columns is None else _column_subset_schema(model, tuple(columns))
     try:
         df = _convert_string_dtype_to_object(df)
-        model_df = model.validate(df, lazy=True)
+        model_df = schema.validate(df, lazy=True)
         model_df = _convert_string_dtype_to_object(model_df)
-        model_df = fill_df_with_defaults_from_model(model_df, model)
+        model_df = fill_df_with_defaults_from_model(model_df, model, columns)
         model_df.attrs = attrs
         return model_df
     except (TypeError, ValueError) as e:
@@ -209,7 +227,13 @@ def coerce_extra_fields_to_type_in_df(
             data.__dict__[field], model.__annotations__[field], df
         )
 
-    for field in extra_attributes_undefined_in_model(data, model):
+    extra_fields = extra_attributes_undefined_in_model(data, model)
+    missing_fields = set(extra_fields) - set(df.columns)
+    if missing_fields:
+        msg = f"Fields not found in dataframe columns: {sorted(missing_fields)}"
+        raise DatamodelDataframeIncompatableError(msg)
+
+    for field in extra_fields:
         try:
             v = coerce_val_to_df_types(field, data.model_extra[field], df)
         except ValueError as err:
@@ -244,24 +268,32 @@ def _is_type_from_type_hint(type_hint_value, type_to_check):
     return False
 
 
+@cache
+def _pyd_validated_func(func):
+    """Build (once per function) the pydantic-validated version of func without Pandera types.
+
+    Resolving type hints and constructing the pydantic validator are both expensive, so the
+    result is cached rather than rebuilt on every call.
+    """
+    type_hints = get_type_hints(func)
+    # Modify the type hints to replace pandera DataFrame models with pandas DataFrames
+    modified_type_hints = {
+        key: value
+        for key, value in type_hints.items()
+        if not _is_type_from_type_hint(value, PanderaDataFrame)
+    }
+
+    new_func = func
+    new_func.__annotations__ = modified_type_hints
+    return validate_call(new_func, config={"arbitrary_types_allowed": True})
+
+
 def validate_call_pyd(func):
     """Decorator to validate the function i/o using Pydantic models without Pandera."""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        type_hints = get_type_hints(func)
-        # Modify the type hints to replace pandera DataFrame models with pandas DataFrames
-        modified_type_hints = {
-            key: value
-            for key, value in type_hints.items()
-            if not _is_type_from_type_hint(value, PanderaDataFrame)
-        }
-
-        new_func = func
-        new_func.__annotations__ = modified_type_hints
-        validated_func = validate_call(new_func, config={"arbitrary_types_allowed": True})
-
-        return validated_func(*args, **kwargs)
+        return _pyd_validated_func(func)(*args, **kwargs)
 
     return wrapper
 
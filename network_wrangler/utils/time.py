@@ -184,13 +184,15 @@ def filter_df_to_overlapping_timespans(
         WranglerLogger.error(msg)
         raise TimespanDfQueryError(msg)
 
-    mask = pd.Series([False] * len(orig_df), index=orig_df.index)
+    start_time_s = orig_df["start_time"]
+    end_time_s = orig_df["end_time"]
+    # end times before start times are on the next day; doesn't depend on the query timespan
+    end_time_s = end_time_s.mask(end_time_s < start_time_s, end_time_s + pd.Timedelta(days=1))
+
+    mask = pd.Series(False, index=orig_df.index)
     for query_timespan in query_timespans:
         q_start_time, q_end_time = str_to_time_list(query_timespan)
-        end_time_s = orig_df["end_time"].copy()
-        end_time_s.loc[orig_df["end_time"] < orig_df["start_time"]] += pd.Timedelta(days=1)
-        this_ts_mask = (orig_df["start_time"] < q_end_time) & (q_start_time < end_time_s)
-        mask |= this_ts_mask
+        mask |= (start_time_s < q_end_time) & (q_start_time < end_time_s)
     return orig_df.loc[mask]
 
 
@@ -271,9 +273,16 @@ def filter_df_to_max_overlapping_timespans(
 
 
 def convert_timespan_to_start_end_dt(timespan_s: pd.Serie[str]) -> pd.DataFrame:
-    """Convert a timespan string ['12:00','14:00] to start_time & end_time datetime cols in df."""
-    start_time = timespan_s.apply(lambda x: str_to_time(x[0]))
-    end_time = timespan_s.apply(lambda x: str_to_time(x[1]))
+    """Convert a timespan string ['12:00','14:00] to start_time & end_time datetime cols in df.
+
+    Scoped values reuse a handful of timespans, so each unique timespan is only parsed once.
+    """
+    timespan_tuples = timespan_s.map(tuple)
+    timespan_to_dt = {
+        ts: (str_to_time(ts[0]), str_to_time(ts[1])) for ts in timespan_tuples.unique()
+    }
+    start_time = timespan_tuples.map(lambda ts: timespan_to_dt[ts][0])
+    end_time = timespan_tuples.map(lambda ts: timespan_to_dt[ts][1])
     return pd.DataFrame({"start_time": start_time, "end_time": end_time})
 
 
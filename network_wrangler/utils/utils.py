@@ -1,6 +1,7 @@
 """General utility functions used throughout package."""
 
 import hashlib
+import json
 import re
 
 from pydantic import validate_call
@@ -170,13 +171,15 @@ def split_string_prefix_suffix_from_num(input_string: str):
 def dict_to_hexkey(d: dict) -> str:
     """Converts a dictionary to a hexdigest of the sha1 hash of the dictionary.
 
+    Keys are sorted so that dictionaries which only differ in key order share a hexkey.
+
     Args:
         d (dict): dictionary to convert to string
 
     Returns:
         str: hexdigest of the sha1 hash of dictionary
     """
-    return hashlib.sha1(str(d).encode()).hexdigest()
+    return hashlib.sha1(json.dumps(d, sort_keys=True, default=str).encode()).hexdigest()
 
 
 def combine_unique_unhashable_list(list1: list, list2: list):